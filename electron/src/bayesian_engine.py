@@ -68,8 +68,21 @@ class BayesianEngine:
                 "recent_performance": deque(maxlen=100),
             }
 
+    def batch_update(self, evidence_list) -> Dict[str, Optional[float]]:
+        """Add (hypothesis, evidence_id, likelihood, source, reliability) tuples and return posteriors"""
+        for evidence in evidence_list:
+            self.add_evidence(*evidence)
+        now = time.time()
+        return {
+            hypothesis: self._posterior(hypothesis, now)
+            for hypothesis, *_ in evidence_list
+        }
+
     def calculate_posterior(self, hypothesis: str) -> Optional[float]:
         """Calculate posterior probability using Bayes' theorem"""
+        return self._posterior(hypothesis, time.time())
+
+    def _posterior(self, hypothesis: str, now: float) -> Optional[float]:
         if hypothesis not in self.priors:
             return None
 
@@ -83,7 +96,7 @@ class BayesianEngine:
         total_likelihood = 1.0
         for evidence in evidence_list:
             # Weight by reliability and recency
-            time_decay = self._calculate_time_decay(evidence.timestamp)
+            time_decay = self._calculate_time_decay(evidence.timestamp, now=now)
             weight = evidence.reliability * time_decay
             weighted_likelihood = evidence.likelihood * weight + (1 - weight) * 0.5
             total_likelihood *= weighted_likelihood
@@ -100,7 +113,19 @@ class BayesianEngine:
         posterior = (prior_prob * total_likelihood) / marginal_probability
         return min(1.0, max(0.0, posterior))
 
-    def update_with_outcome(self, hypothesis: str, success: bool, weight: float = 1.0):
+    def update_with_outcomes(self, outcomes):
+        """Apply (hypothesis, success, weight) outcomes with one timestamp"""
+        now = time.time()
+        for hypothesis, success, weight in outcomes:
+            self.update_with_outcome(hypothesis, success, weight, now=now)
+
+    def update_with_outcome(
+        self,
+        hypothesis: str,
+        success: bool,
+        weight: float = 1.0,
+        now: Optional[float] = None,
+    ):
         """Update prior based on outcome"""
         if hypothesis not in self.hypothesis_tracking:
             return
@@ -128,13 +153,16 @@ class BayesianEngine:
             current_prior = self.priors[hypothesis].prior_probability
             updated_prior = current_prior * (1 - weight) + new_prior * weight
             self.priors[hypothesis].prior_probability = updated_prior
-            self.priors[hypothesis].last_updated = time.time()
+            self.priors[hypothesis].last_updated = time.time() if now is None else now
 
     def _calculate_time_decay(
-        self, evidence_timestamp: float, half_life: float = 24 * 3600
+        self,
+        evidence_timestamp: float,
+        half_life: float = 24 * 3600,
+        now: Optional[float] = None,
     ) -> float:
         """Calculate time decay factor for evidence"""
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         time_diff = current_time - evidence_timestamp
         decay_factor = 0.5 ** (time_diff / half_life)
         return decay_factor
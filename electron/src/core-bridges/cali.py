@@ -3,6 +3,12 @@ import sys
 import json
 from pathlib import Path
 
+# orjson parses inbound IPC lines several times faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # --- WIRE AS NEEDED: Connect to Adaptive Cochlear Processor ---
 REPO_ROOT = (
     Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent.parent.parent
@@ -21,11 +27,14 @@ except Exception as e:
     ACP_ACTIVE = False
     # Don't print here to avoid polluting stdout before READY
 
+# Compact encoder reused for every stdout response
+_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 print("READY: CALI", flush=True)
 
 for line in sys.stdin:
     try:
-        msg = json.loads(line)
+        msg = _json_loads(line)
     except Exception:
         continue
     if msg.get("type") == "query":
@@ -53,4 +62,5 @@ for line in sys.stdin:
                 ],
             },
         }
-        print(json.dumps(result), flush=True)
+        sys.stdout.write(_ENCODE(result) + "\n")
+        sys.stdout.flush()
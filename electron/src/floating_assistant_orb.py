@@ -4,17 +4,43 @@ Exposes CALIFloatingOrb for PythonShell usage and supports a simple stdin/stdout
 message loop so the Electron bridge can coordinate readiness and queries.
 """
 
+import asyncio
+import atexit
+import io
 import json
+import math
+import os
 import sys
+import tempfile
 import time
+import queue
+import re
 import threading
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import stat
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+# orjson parses inbound IPC lines several times faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Fix Windows unicode stdout issues
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8")
 
+# Harnesses opt into 4-byte little-endian length-prefixed frames with --framed
+# (Electron keeps JSON lines); prints move to stderr so they can't split a frame
+FRAMED_IPC = "--framed" in sys.argv[1:]
+_IPC_OUT = sys.stdout.buffer if FRAMED_IPC else sys.stdout
+if FRAMED_IPC:
+    sys.stdout = sys.stderr
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 sys.path.insert(0, str(PROJECT_ROOT))
 
@@ -45,6 +71,13 @@ except ImportError as e:
     SPEECH_AVAILABLE = False
     MicCapture = None
 
+# soundfile encodes WAV for processors that lack hear_array
+try:
+    import soundfile as sf
+except ImportError as e:
+    print(f"⚠️ soundfile import failed: {e}", file=sys.stderr)
+    sf = None
+
 # Try to import CoquiBaseline
 try:
     from coqui_baseline.synthesize import CoquiBaseline
@@ -66,13 +99,136 @@ except ImportError:
 
 from orb_controller import SF_ORB_Controller  # noqa: E402
 
+# Compact encoder reused for every stdout IPC message
+_ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Longest stdin IPC line accepted before it is skipped (bytes)
+STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+# Encoded IPC lines waiting for the writer thread (None asks it to exit)
+_OUTBOX = queue.SimpleQueue()
+_writer_thread = None
+# Set by the writer thread once stdout is gone; _serve installs the callback
+_OUTPUT_LOST = threading.Event()
+_on_output_lost = None
+
+
+def _writer_loop():
+    """Sole owner of stdout, so producer threads never block on a slow reader."""
+    while True:
+        line = _OUTBOX.get()
+        if line is None:
+            break
+        try:
+            _IPC_OUT.write(line)
+            _IPC_OUT.flush()
+        except OSError as e:
+            # BrokenPipeError and friends: Electron is gone, so shut the orb down
+            print(f"IPC output lost, shutting down: {e}", file=sys.stderr)
+            _OUTPUT_LOST.set()
+            callback = _on_output_lost
+            if callback is not None:
+                callback()
+            break
+        except Exception as e:
+            print(f"Dropping IPC message: {e}", file=sys.stderr)
+
+
+def _start_writer():
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, name="orb-stdout")
+        _writer_thread.daemon = True
+        _writer_thread.start()
+        atexit.register(_stop_writer)
+
+
+def _stop_writer():
+    """Flush every queued message and stop the writer thread."""
+    global _writer_thread
+    if _writer_thread is not None:
+        _OUTBOX.put(None)
+        _writer_thread.join()
+        _writer_thread = None
+
+
+def _emit(message):
+    """Queue one JSON-lines message (or frame) for the Electron bridge."""
+    if FRAMED_IPC:
+        data = _ENCODE(message).encode("utf-8")
+        _OUTBOX.put(len(data).to_bytes(4, "little") + data)
+    else:
+        _OUTBOX.put(_ENCODE(message) + "\n")
+
+
+def _pulse_of(thought):
+    """Pulse dict for a controller result without probing for a pulse attribute."""
+    # Lightning bypass returns dict directly; None means the stimulus was rejected
+    if thought is None or type(thought) is dict:
+        return thought
+    return thought.pulse()
+
+
+# Speech loop error backoff bounds (seconds)
+SPEECH_BACKOFF_MIN = 0.01
+SPEECH_BACKOFF_MAX = 0.5
+
+# Verbal trigger phrase -> (IPC command, spoken acknowledgement).
+# Insertion order is the match priority when several triggers are heard.
+_VERBAL_COMMANDS = {
+    "slow down": ("slow_down", "Slowing down"),
+    "speed up": ("speed_up", "Speeding up"),
+    "change color": ("change_color", "Changing color"),
+    "increase size": ("increase_size", "Increasing size"),
+    "decrease size": ("decrease_size", "Decreasing size"),
+}
+_VERBAL_COMMAND_RE = re.compile("|".join(map(re.escape, _VERBAL_COMMANDS)))
+_VERBAL_COMMAND_RANK = {trigger: i for i, trigger in enumerate(_VERBAL_COMMANDS)}
+
+# Spoken color name -> orb color; insertion order is the match priority
+_COLOR_MAP = MappingProxyType({"blue": "#00ff88", "red": "#ff4444", "green": "#44ff44"})
+_DEFAULT_COLOR = "#00ff88"  # default glassy blue-green
+
+# UCM liveness probe target and connect timeout (seconds)
+UCM_ADDRESS = ("127.0.0.1", 5050)
+UCM_PROBE_TIMEOUT = 0.1
+
+# Cursor moves closer together than this are coalesced into the latest one
+CURSOR_COALESCE_WINDOW_NS = 16_000_000
+
+# Raw cursor samples kept (power of two) for vectorized step/discontinuity checks
+CURSOR_RING_SIZE = 1024
+_CURSOR_RING_MASK = CURSOR_RING_SIZE - 1
+
 
 class CALIFloatingOrb:
     def __init__(self, project_root):
         self.controller = SF_ORB_Controller()
         self.running = False
+        self.ucm_ready = False
         self.last_cursor_pos = (0, 0)
-        self.last_time = time.time()
+        self.last_time_ns = time.monotonic_ns()
+
+        # The controller is not thread-safe; every cognitively_emerge holds this
+        self._cognition_lock = threading.Lock()
+        # Set by _cognitive_loop; trailing-edge cursor flushes are queued there
+        self._loop = None
+        self._inbox = None
+
+        # Cursor coalescing: latest unsent position and the one cursor job
+        # allowed to be queued or running for it
+        self._cursor_lock = threading.Lock()
+        self._last_emit_ns = 0
+        self._pending_xy = None
+        self._cursor_job_active = False
+        # Every raw sample, coalesced or not, as x/y int32 columns
+        self._cx = np.zeros(CURSOR_RING_SIZE, dtype=np.int32)
+        self._cy = np.zeros(CURSOR_RING_SIZE, dtype=np.int32)
+        self._cursor_head = 0
+
+        # Shared workers: one runs the speech loop, the other cognition jobs
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="orb")
+        self._speech_future = None
 
         self.voice = None
         if ACP_AVAILABLE:
@@ -85,6 +241,10 @@ class CALIFloatingOrb:
                 print(f"Voice init failed: {e}", file=sys.stderr)
 
         self.mic = None
+        # Single RAM-backed WAV buffer reused for every speech chunk
+        self._wav_buffer = io.BytesIO()
+        # Whether processor.hear() takes a file object; None until first tried
+        self._hear_accepts_stream = None
         if SPEECH_AVAILABLE:
             try:
                 print("Initializing Speech Recognition...", file=sys.stderr)
@@ -104,69 +264,88 @@ class CALIFloatingOrb:
 
     def start_speech_recognition(self):
         if self.mic:
-            import threading
-
-            self.speech_thread = threading.Thread(target=self._speech_loop)
-            self.speech_thread.daemon = True
-            self.speech_thread.start()
+            self._speech_future = self._pool.submit(self._speech_loop)
 
     def _speech_loop(self):
-        import soundfile as sf
-        import tempfile
-        import os
-
+        backoff = SPEECH_BACKOFF_MIN
         while self.running:
             try:
-                # Record and process audio chunk
-                audio_data = self.mic.record_chunk()
-
-                # Save to temp file since processor expects a file path
-                with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
-                ) as temp_file:
-                    temp_path = temp_file.name
-                    sf.write(temp_path, audio_data.flatten(), self.mic.sample_rate)
-
-                try:
-                    transcription = self.mic.processor.hear(temp_path)
-
-                    if transcription and transcription.strip():
-                        print(f"🎤 Heard: {transcription}", file=sys.stderr)
-
-                        # Check for verbal commands
-                        self._process_verbal_command(transcription)
-
-                        # Process the speech input like a text query
-                        stimulus = {
-                            "type": "speech_query",
-                            "content": transcription,
-                            "coordinates": [0, 0],
-                            "velocity": 0.0,
+                transcription = self._record_and_transcribe()
+
+                if transcription and transcription.strip():
+                    print(f"🎤 Heard: {transcription}", file=sys.stderr)
+
+                    # Check for verbal commands
+                    self._process_verbal_command(transcription)
+
+                    # Process the speech input like a text query
+                    stimulus = {
+                        "type": "speech_query",
+                        "content": transcription,
+                        "coordinates": [0, 0],
+                        "velocity": 0.0,
+                    }
+
+                    thought = self.emerge(stimulus)
+                    if thought:
+                        pulse = _pulse_of(thought)
+
+                        # Send cognitive pulse to Electron
+                        response = {
+                            "type": "speech_pulse",
+                            "data": pulse,
+                            "transcription": transcription,
                         }
+                        _emit(response)
 
-                        thought = self.controller.cognitively_emerge(stimulus)
-                        if thought:
-                            pulse = (
-                                thought.pulse()
-                                if hasattr(thought, "pulse")
-                                else thought
-                            )
-
-                            # Send cognitive pulse to Electron
-                            response = {
-                                "type": "speech_pulse",
-                                "data": pulse,
-                                "transcription": transcription,
-                            }
-                            print(json.dumps(response), flush=True)
-                finally:
-                    # Clean up temp file
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-
+                backoff = SPEECH_BACKOFF_MIN
             except Exception as e:
                 print(f"Speech processing error: {e}", file=sys.stderr)
-                time.sleep(1)
+                # Exponential backoff keeps transient errors from adding a full second
+                time.sleep(backoff)
+                backoff = min(backoff * 2, SPEECH_BACKOFF_MAX)
+
+    def _record_and_transcribe(self):
+        """Capture one mic chunk and transcribe it."""
+        # record_chunk already returns a fresh array; flatten it as a view
+        return self._transcribe(self.mic.record_chunk().reshape(-1))
+
+    def _transcribe(self, audio_data):
+        """Hand a mic chunk to the recognizer without a disk round-trip."""
+        processor = self.mic.processor
+        pcm = audio_data.reshape(-1)
+        if hasattr(processor, "hear_array"):
+            return processor.hear_array(pcm, self.mic.sample_rate)
+
+        # Processor only accepts a file: encode the WAV into the reused RAM buffer
+        if self._hear_accepts_stream is not False:
+            wav_buffer = self._wav_buffer
+            wav_buffer.seek(0)
+            wav_buffer.truncate()
+            sf.write(wav_buffer, pcm, self.mic.sample_rate, format="WAV")
+            wav_buffer.seek(0)
+            try:
+                transcription = processor.hear(wav_buffer)
+            except (TypeError, ValueError, AttributeError, OSError) as e:
+                if self._hear_accepts_stream:
+                    raise
+                print(
+                    f"hear() rejected an in-memory WAV ({e}); using temp files",
+                    file=sys.stderr,
+                )
+                self._hear_accepts_stream = False
+            else:
+                self._hear_accepts_stream = True
+                return transcription
+
+        # Path-only processor: same temp WAV round-trip as before
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            temp_path = temp_file.name
+        try:
+            sf.write(temp_path, pcm, self.mic.sample_rate)
+            return processor.hear(temp_path)
+        finally:
+            os.unlink(temp_path)
 
     def _process_verbal_command(self, transcription):
         """Process verbal commands starting with 'CALI'"""
@@ -175,67 +354,120 @@ class CALIFloatingOrb:
 
         command = transcription.lower()[5:].strip()
 
-        if "slow down" in command:
-            # Adjust animation speed (send to Electron)
-            response = {"type": "verbal_command", "command": "slow_down"}
-            print(json.dumps(response), flush=True)
-            if self.voice:
-                self.speak("Slowing down")
-
-        elif "speed up" in command:
-            response = {"type": "verbal_command", "command": "speed_up"}
-            print(json.dumps(response), flush=True)
-            if self.voice:
-                self.speak("Speeding up")
+        # One regex pass finds every trigger; table order decides which wins
+        triggers = _VERBAL_COMMAND_RE.findall(command)
+        if not triggers:
+            return
+        trigger = min(triggers, key=_VERBAL_COMMAND_RANK.__getitem__)
+        name, acknowledgement = _VERBAL_COMMANDS[trigger]
 
-        elif "change color" in command:
+        response = {"type": "verbal_command", "command": name}
+        if name == "change_color":
             # Extract color if specified
-            if "blue" in command:
-                color = "#00ff88"
-            elif "red" in command:
-                color = "#ff4444"
-            elif "green" in command:
-                color = "#44ff44"
-            else:
-                color = "#00ff88"  # default glassy blue-green
-
-            response = {
-                "type": "verbal_command",
-                "command": "change_color",
-                "color": color,
-            }
-            print(json.dumps(response), flush=True)
-            if self.voice:
-                self.speak("Changing color")
-
-        elif "increase size" in command:
-            response = {"type": "verbal_command", "command": "increase_size"}
-            print(json.dumps(response), flush=True)
-            if self.voice:
-                self.speak("Increasing size")
-
-        elif "decrease size" in command:
-            response = {"type": "verbal_command", "command": "decrease_size"}
-            print(json.dumps(response), flush=True)
-            if self.voice:
-                self.speak("Decreasing size")
+            response["color"] = next(
+                (
+                    hex_
+                    for color_name, hex_ in _COLOR_MAP.items()
+                    if color_name in command
+                ),
+                _DEFAULT_COLOR,
+            )
+
+        # Animation speed/size/color changes are applied by Electron
+        _emit(response)
+        if self.voice:
+            self.speak(acknowledgement)
+
+    def emerge(self, stimulus):
+        """Run one stimulus through the controller, one caller at a time."""
+        with self._cognition_lock:
+            return self.controller.cognitively_emerge(stimulus)
 
     def stop(self):
         self.running = False
-        if hasattr(self, "cognitive_thread"):
-            self.cognitive_thread.join(timeout=1)
-        if hasattr(self, "speech_thread"):
-            self.speech_thread.join(timeout=1)
+        if self._speech_future is not None:
+            try:
+                self._speech_future.result(timeout=1)
+            except Exception:
+                pass
+        self._pool.shutdown(wait=False)
 
     def process_cursor_movement(self, x, y):
-        current_time = time.time()
+        """Record a move and run cognition on it right away (direct callers)."""
+        with self._cursor_lock:
+            self._record_cursor(x, y)
+            self._last_emit_ns = time.monotonic_ns()
+        return self._emit_cursor_pulse(x, y)
+
+    def queue_cursor_move(self, x, y):
+        """Record a move from the serve loop, keeping only the latest position.
+
+        At most one cursor job is queued or running at a time; moves that arrive
+        meanwhile just replace the pending position, which that job flushes.
+        """
+        with self._cursor_lock:
+            self._record_cursor(x, y)
+            self._pending_xy = (x, y)
+            if self._cursor_job_active or self._loop is None:
+                return
+            self._cursor_job_active = True
+            target = self._loop, self._inbox, self._cursor_delay()
+        self._schedule_cursor_job(*target)
+
+    def recent_cursor_steps(self, count=CURSOR_RING_SIZE):
+        """Pixel distance between consecutive raw samples, oldest first."""
+        with self._cursor_lock:
+            head = self._cursor_head
+            count = min(count, head, CURSOR_RING_SIZE)
+            idx = np.arange(head - count, head) & _CURSOR_RING_MASK
+            xs = self._cx[idx]
+            ys = self._cy[idx]
+        return np.hypot(np.diff(xs), np.diff(ys))
+
+    def _record_cursor(self, x, y):
+        # Caller holds _cursor_lock
+        i = self._cursor_head & _CURSOR_RING_MASK
+        self._cx[i] = x
+        self._cy[i] = y
+        self._cursor_head += 1
+
+    def _cursor_delay(self):
+        # Caller holds _cursor_lock; seconds left in the current coalescing window
+        since_emit_ns = time.monotonic_ns() - self._last_emit_ns
+        return max(CURSOR_COALESCE_WINDOW_NS - since_emit_ns, 0) / 1e9
+
+    def _schedule_cursor_job(self, loop, inbox, delay):
+        loop.call_soon_threadsafe(
+            loop.call_later, delay, inbox.put_nowait, (self._run_cursor_job, ())
+        )
+
+    def _run_cursor_job(self):
+        # Snapshot under the lock; cognition runs outside it
+        with self._cursor_lock:
+            pending, self._pending_xy = self._pending_xy, None
+            self._last_emit_ns = time.monotonic_ns()
+        if pending is not None and self.running:
+            self._emit_cursor_pulse(*pending)
+
+        with self._cursor_lock:
+            if self._pending_xy is None or self._loop is None:
+                self._cursor_job_active = False
+                return
+            # Trailing flush for moves that arrived while this job ran
+            target = self._loop, self._inbox, self._cursor_delay()
+        self._schedule_cursor_job(*target)
+
+    def _emit_cursor_pulse(self, x, y):
+        # Velocity spans every coalesced move since the last emitted position
+        now_ns = time.monotonic_ns()
         dx = x - self.last_cursor_pos[0]
         dy = y - self.last_cursor_pos[1]
-        dt = current_time - self.last_time
-        velocity = ((dx**2 + dy**2) ** 0.5) / max(dt, 0.001) if dt > 0 else 0
+        # Integer guard: treat anything under 1ms as 1ms
+        dt_ns = max(now_ns - self.last_time_ns, 1_000_000)
+        velocity = math.hypot(dx, dy) * 1e9 / dt_ns
 
         self.last_cursor_pos = (x, y)
-        self.last_time = current_time
+        self.last_time_ns = now_ns
 
         stimulus = {
             "type": "cursor_movement",
@@ -244,118 +476,270 @@ class CALIFloatingOrb:
             "intent": "navigation",
         }
 
-        thought = self.controller.cognitively_emerge(stimulus)
+        thought = self.emerge(stimulus)
         if thought:
-            if hasattr(thought, "pulse"):
-                pulse = thought.pulse()
-            else:
-                # Lightning bypass returns dict directly
-                pulse = thought
+            pulse = _pulse_of(thought)
             # Send cognitive pulse to Electron
             response = {"type": "cognitive_pulse", "data": pulse}
-            print(json.dumps(response), flush=True)
+            _emit(response)
             return pulse
         return None
 
-    def _cognitive_loop(self):
-        while self.running:
-            # Periodic cognitive processing if needed
-            time.sleep(0.1)
+    async def _cognitive_loop(self, inbox):
+        """Run queued cognition jobs in arrival order on a worker thread."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._inbox = inbox
+        try:
+            while True:
+                job, args = await inbox.get()
+                try:
+                    await loop.run_in_executor(self._pool, job, *args)
+                except Exception as e:
+                    print(f"Cognitive job failed: {e}", file=sys.stderr)
+                finally:
+                    inbox.task_done()
+        finally:
+            # Stop queueing cursor flushes onto a loop that is going away
+            with self._cursor_lock:
+                self._loop = None
 
     def start(self):
         self.running = True
-        # Start background cognitive processing
-        self.cognitive_thread = threading.Thread(target=self._cognitive_loop)
-        self.cognitive_thread.daemon = True
-        self.cognitive_thread.start()
+        _start_writer()
 
         # Start speech recognition
         self.start_speech_recognition()
 
+    def probe_ucm(self):
+        """TCP liveness check for the UCM server; updates self.ucm_ready."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(UCM_PROBE_TIMEOUT)
+                self.ucm_ready = sock.connect_ex(UCM_ADDRESS) == 0
+        except OSError as e:
+            print(f"UCM status check failed: {e}", file=sys.stderr)
+            self.ucm_ready = False
+            return False
+        if self.ucm_ready:
+            print("UCM status active", file=sys.stderr)
+        else:
+            print("UCM status not active", file=sys.stderr)
+        return self.ucm_ready
+
     def get_status(self):
         return {
             "running": self.running,
             "controller_status": "active" if self.controller else "inactive",
+            "ucm_ready": self.ucm_ready,
         }
 
 
 __all__ = ["CALIFloatingOrb"]
 
 
-def _main() -> None:
-    """Run Orb and respond to simple IPC messages over stdin/stdout (JSON lines)."""
-    orb = CALIFloatingOrb(PROJECT_ROOT)
-    orb.start()
-
-    # Check UCM status
+def _answer_query(orb, text):
+    """Run a text query through SF-ORB cognition and emit the query_result."""
+    stimulus = {
+        "type": "text_query",
+        "content": text,
+        "coordinates": [0, 0],  # dummy
+        "velocity": 0.0,
+    }
+    result = orb.emerge(stimulus)
+
+    # Synthesize response
+    response_text = f"Analyzed: {text}"
+    audio_path = None
+    if orb.voice:
+        audio_path = orb.speak(response_text)
+
+    response = {
+        "type": "query_result",
+        "data": {
+            "echo": text,
+            "response_text": response_text,
+            "audio_path": audio_path,
+            "cognitive_result": _pulse_of(result),
+            "state": orb.get_status(),
+        },
+    }
+    _emit(response)
+
+
+def _stdin_is_pipe():
+    """True when stdin can back a pipe transport (not a redirected regular file)."""
+    if sys.platform == "win32":
+        # Proactor loops can't wrap a stdin pipe at all
+        return False
     try:
-        with urllib.request.urlopen(
-            "http://localhost:5050/orb/status", timeout=5
-        ) as response:
-            data = json.loads(response.read().decode())
-            if data.get("status") == "active":
-                print("UCM status active", file=sys.stderr)
-            else:
-                print("UCM status not active", file=sys.stderr)
-    except Exception as e:
-        print(f"UCM status check failed: {e}", file=sys.stderr)
+        mode = os.fstat(sys.stdin.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)
+
+
+async def _stdin_thread(read_item):
+    """Yield read_item() results, read on one dedicated "orb-stdin" thread.
+
+    Used when stdin can't back a pipe transport. The thread is a daemon so a
+    read still blocked at exit never holds up shutdown; read_item returns None
+    at end of input.
+    """
+    loop = asyncio.get_running_loop()
+    items = asyncio.Queue()
+
+    def pump():
+        while True:
+            try:
+                item = read_item()
+            except Exception as e:
+                print(f"stdin read failed: {e}", file=sys.stderr)
+                item = None
+            try:
+                loop.call_soon_threadsafe(items.put_nowait, item)
+            except RuntimeError:
+                return  # loop already closed
+            if item is None:
+                return
+
+    threading.Thread(target=pump, name="orb-stdin", daemon=True).start()
+    while True:
+        item = await items.get()
+        if item is None:
+            return
+        yield item
 
-    # Signal readiness to Electron bridge
-    print(json.dumps({"type": "ready"}), flush=True)
 
-    for line in sys.stdin:
+def _read_stdin_line():
+    return sys.stdin.readline() or None
+
+
+def _read_stdin_frame():
+    header = sys.stdin.buffer.read(4)
+    if len(header) < 4:
+        return None
+    size = int.from_bytes(header, "little")
+    payload = sys.stdin.buffer.read(size)
+    return payload if len(payload) == size else None
+
+
+async def _stdin_lines():
+    """Yield stdin lines without blocking the event loop."""
+    if not _stdin_is_pipe():
+        async for line in _stdin_thread(_read_stdin_line):
+            yield line
+        return
+
+    loop = asyncio.get_running_loop()
+
+    reader = asyncio.StreamReader(limit=STDIN_LINE_LIMIT)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+    while True:
         try:
-            msg = json.loads(line.strip())
-        except Exception:
+            line = await reader.readline()
+        except ValueError as e:
+            # Oversized line: readline drops it, so log and keep serving
+            print(f"Skipping oversized IPC line: {e}", file=sys.stderr)
             continue
+        if not line:
+            return
+        yield line
+
+
+async def _stdin_frames():
+    """Yield length-prefixed stdin payloads without blocking the event loop."""
+    if not _stdin_is_pipe():
+        async for payload in _stdin_thread(_read_stdin_frame):
+            yield payload
+        return
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+    while True:
+        try:
+            header = await reader.readexactly(4)
+            yield await reader.readexactly(int.from_bytes(header, "little"))
+        except asyncio.IncompleteReadError:
+            return
 
-        msg_type = msg.get("type")
 
-        if msg_type == "shutdown":
-            orb.stop()
-            print(json.dumps({"type": "shutdown_ack"}), flush=True)
-            break
+async def _serve(orb):
+    """Dispatch IPC messages on the event loop; cognition runs in a queued task."""
+    global _on_output_lost
+    inbox = asyncio.Queue()
+    cognition = asyncio.create_task(orb._cognitive_loop(inbox))
+    loop = asyncio.get_running_loop()
+    serving = asyncio.current_task()
+
+    def output_lost():
+        try:
+            loop.call_soon_threadsafe(serving.cancel)
+        except RuntimeError:
+            pass  # loop already closed
+
+    _on_output_lost = output_lost
+    if _OUTPUT_LOST.is_set():
+        # stdout broke before serving started; stop at the first await
+        serving.cancel()
+    try:
+        async for line in _stdin_frames() if FRAMED_IPC else _stdin_lines():
+            try:
+                msg = _json_loads(line)
+            except Exception:
+                continue
+
+            msg_type = msg.get("type")
+
+            if msg_type == "shutdown":
+                # Let already-queued cognition finish before acknowledging
+                await inbox.join()
+                orb.stop()
+                _emit({"type": "shutdown_ack"})
+                break
+
+            elif msg_type == "cursor_move":
+                x = msg.get("x", 0)
+                y = msg.get("y", 0)
+                orb.queue_cursor_move(x, y)
+
+            elif msg_type == "get_status":
+                status = orb.get_status()
+                response = {"type": "status_response", "data": status}
+                _emit(response)
+
+            elif msg_type == "query":
+                text = msg.get("text", "")
+                # Use SF-ORB cognitive processing
+                inbox.put_nowait((_answer_query, (orb, text)))
+    except asyncio.CancelledError:
+        # The writer lost stdout; nobody is left to answer
+        print("Stopping: IPC output closed", file=sys.stderr)
+    finally:
+        _on_output_lost = None
+        cognition.cancel()
+
+
+def _main() -> None:
+    """Run Orb and respond to simple IPC messages over stdin/stdout (JSON lines or frames)."""
+    orb = CALIFloatingOrb(PROJECT_ROOT)
+    orb.start()
+
+    # Probe UCM in the background so readiness is not held up by it
+    orb._pool.submit(orb.probe_ucm)
+
+    # Signal readiness to Electron bridge
+    _emit({"type": "ready"})
 
-        elif msg_type == "cursor_move":
-            x = msg.get("x", 0)
-            y = msg.get("y", 0)
-            orb.process_cursor_movement(x, y)
-
-        elif msg_type == "get_status":
-            status = orb.get_status()
-            response = {"type": "status_response", "data": status}
-            print(json.dumps(response), flush=True)
-
-        elif msg_type == "query":
-            text = msg.get("text", "")
-            # Use SF-ORB cognitive processing
-            stimulus = {
-                "type": "text_query",
-                "content": text,
-                "coordinates": [0, 0],  # dummy
-                "velocity": 0.0,
-            }
-            result = orb.controller.cognitively_emerge(stimulus)
-
-            # Synthesize response
-            response_text = f"Analyzed: {text}"
-            audio_path = None
-            if orb.voice:
-                audio_path = orb.speak(response_text)
-
-            response = {
-                "type": "query_result",
-                "data": {
-                    "echo": text,
-                    "response_text": response_text,
-                    "audio_path": audio_path,
-                    "cognitive_result": (
-                        result.pulse() if hasattr(result, "pulse") else result
-                    ),
-                    "state": orb.get_status(),
-                },
-            }
-            print(json.dumps(response), flush=True)
+    asyncio.run(_serve(orb))
+    # stdin may close without a shutdown message; stop the workers either way
+    orb.stop()
+    _stop_writer()
 
 
 if __name__ == "__main__":
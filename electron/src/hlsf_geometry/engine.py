@@ -28,6 +28,8 @@ class HLSFEngine:
     def __init__(self, dimension: int = 18):
         self.dimension = dimension
         self.field_map: Dict[str, HLSFNode] = {}
+        # Bumped whenever field_map gains or loses nodes, so readers can memoize
+        self._revision = 0
         self.cursor_position = (0.0,) * dimension
         self.pulse_frequency = 0.0
         self.max_field_density = 1000
@@ -73,6 +75,7 @@ class HLSFEngine:
                 cognitive_load=min(initial_vivacity, 10.0),
             )
             self.field_map[node_id] = node
+            self._revision += 1
             node_obj = node
         else:
             node = self.field_map[node_id]
@@ -125,6 +128,7 @@ class HLSFEngine:
         if node_ref is None and node_obj is not None:
             sys.stderr.write(f"DEBUG: Node {node_id} purged during add -- recreating\n")
             self.field_map[node_id] = node_obj
+            self._revision += 1
             node_ref = node_obj
 
         return node_ref
@@ -253,6 +257,7 @@ class HLSFEngine:
             new_id = f"NODE_{n.n}_{n.k}_{hash(n.coordinates)}"
             self.field_map[new_id] = n
 
+        self._revision += 1
         purged = current_density - len(self.field_map)
         self.edge_cutter_active = True
         print(
@@ -1,7 +1,35 @@
-import math
-from PySide6.QtCore import QPointF, QRectF
 import numpy as np
 
+# Optional JIT: fuses the whole field tick into one compiled kernel
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _fused_tick(grid, noise, decay, noise_scale, force_scale, force_x, force_y):
+    """Decay + noise + clip the grid in place, then refresh the force field."""
+    height, width = grid.shape
+    for y in range(height):
+        for x in range(width):
+            v = grid[y, x] * decay + noise[y, x] * noise_scale
+            grid[y, x] = min(max(v, 0.0), 1.0)
+    # Same zero-bordered two-point stencil as the NumPy path
+    for y in range(height):
+        for x in range(width):
+            left = grid[y, x - 1] if x > 0 else 0.0
+            right = grid[y, x + 1] if x < width - 1 else 0.0
+            top = grid[y - 1, x] if y > 0 else 0.0
+            bottom = grid[y + 1, x] if y < height - 1 else 0.0
+            force_x[y, x] = (left - right) * force_scale
+            force_y[y, x] = (top - bottom) * force_scale
+
+
+if NUMBA_AVAILABLE:
+    _fused_tick = njit(cache=True, fastmath=True)(_fused_tick)
+
 
 class EpistemicGravityField2D:
     """
@@ -13,11 +41,20 @@ class EpistemicGravityField2D:
     def __init__(self, width=32, height=32):
         self.width = width
         self.height = height
-        self.grid = np.zeros((width, height), dtype=np.float32)
+        # Row-major (height, width) indexed [y, x] so X neighbours are contiguous
+        self.grid = np.zeros((height, width), dtype=np.float32)
         self.center = (width // 2, height // 2)
         # Smoothing factor for updates
         self.alpha = 0.2
         self.smoothed_pressure = 0.0
+        # Per-instance RNG drawing into a reusable scratch buffer (no per-tick alloc)
+        self._rng = np.random.default_rng()
+        self._noise = np.empty_like(self.grid)
+        # Zero-bordered copy of the grid and the force field derived from it,
+        # refreshed once per tick so force lookups are plain array reads
+        self._padded = np.zeros((height + 2, width + 2), dtype=np.float32)
+        self._force_x = np.zeros_like(self.grid)
+        self._force_y = np.zeros_like(self.grid)
 
     def update_from_pulse(self, gravity_stats):
         """Update the 2D field based on aggregate statistics from the backend."""
@@ -31,18 +68,45 @@ class EpistemicGravityField2D:
         pressure = self.smoothed_pressure
 
         # Simple simulation: Higher pressure = more turbulence/noise in the field
-        # We decay the current field
-        self.grid *= 0.95
+        self._rng.standard_normal(dtype=np.float32, out=self._noise)
+        if NUMBA_AVAILABLE:
+            _fused_tick(
+                self.grid,
+                self._noise,
+                0.95,
+                pressure * 0.1,
+                5.0,
+                self._force_x,
+                self._force_y,
+            )
+            return pressure
+
+        # We decay the current field (in place; grid size is caller-configurable)
+        np.multiply(self.grid, 0.95, out=self.grid)
 
         # Inject noise based on pressure (simulating the 'hot' outer shell)
-        noise = np.random.normal(0, pressure * 0.1, self.grid.shape)
-        self.grid += noise
+        self._noise *= pressure * 0.1
+        self.grid += self._noise
 
         # Clip
-        self.grid = np.clip(self.grid, 0.0, 1.0)
+        np.clip(self.grid, 0.0, 1.0, out=self.grid)
+
+        self._update_force_field()
 
         return pressure
 
+    def _update_force_field(self):
+        """Precompute the scaled negative gradient used by get_local_force."""
+        # High entropy areas typically repel in this architecture (instability)
+        # So the force points AWAY from high values (flow downhill). Out-of-grid
+        # neighbours read as 0 via the zero border.
+        padded = self._padded
+        padded[1:-1, 1:-1] = self.grid
+        np.subtract(padded[1:-1, :-2], padded[1:-1, 2:], out=self._force_x)
+        np.subtract(padded[:-2, 1:-1], padded[2:, 1:-1], out=self._force_y)
+        self._force_x *= 5.0  # Scale force
+        self._force_y *= 5.0
+
     def get_local_force(self, norm_x, norm_y):
         """
         Get the 2D force vector at a normalized position (0.0 to 1.0).
@@ -55,23 +119,4 @@ class EpistemicGravityField2D:
         gx = max(0, min(gx, self.width - 1))
         gy = max(0, min(gy, self.height - 1))
 
-        # Calculate local gradient (simple finite difference)
-        val = self.grid[gx, gy]
-
-        # Look around
-        # High entropy areas typically repel in this architecture (instability)
-        # So we create a force pointing AWAY from high values
-
-        fx, fy = 0.0, 0.0
-
-        # X gradient
-        left = self.grid[gx - 1, gy] if gx > 0 else 0
-        right = self.grid[gx + 1, gy] if gx < self.width - 1 else 0
-        fx = -(right - left)  # Negative gradient (flow downhill)
-
-        # Y gradient
-        top = self.grid[gx, gy - 1] if gy > 0 else 0
-        bottom = self.grid[gx, gy + 1] if gy < self.height - 1 else 0
-        fy = -(bottom - top)
-
-        return fx * 5.0, fy * 5.0  # Scale force
+        return float(self._force_x[gy, gx]), float(self._force_y[gy, gx])
@@ -1,16 +1,27 @@
 import sys
 import math
 import os
-from collections import deque
+import threading
+import time
+import numpy as np
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
-    QGraphicsDropShadowEffect,
     QLabel,
     QVBoxLayout,
     QHBoxLayout,
 )
-from PySide6.QtCore import Qt, QTimer, QPoint, Signal, QObject, QThread, QRect, QPointF
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QPoint,
+    Signal,
+    Slot,
+    QObject,
+    QThread,
+    QRect,
+    QPointF,
+)
 from PySide6.QtGui import (
     QColor,
     QPainter,
@@ -19,12 +30,70 @@ from PySide6.QtGui import (
     QFont,
     QCursor,
     QRadialGradient,
+    QPolygonF,
 )
 
+# Optional JIT: compiles the per-tick motion/colour integrator to native code
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from orb_controller import SF_ORB_Controller
 from gravity_field_2d import EpistemicGravityField2D
 
+# Master tick is 16ms; cognition runs on every 6th tick (~10Hz)
+COGNITION_EVERY_N_TICKS = 6
+# Latency sparkline history length (ticks)
+SPARKLINE_SAMPLES = 40
+# Worker skips cognition for sub-threshold cursor moves, but still runs it
+# at least this often so field decay keeps ticking
+CURSOR_MOVE_THRESHOLD_PX = 2
+COGNITION_HEARTBEAT_NS = 1_000_000_000
+# Cap on the navigation-vector push from the field (before x40 lookahead)
+NAV_MAX_SPEED = 3.0
+# Transparent border around the 120px orb body where the glow halo is painted
+ORB_PAD = 20
+
+# Sine table for the breathing jitter; phase is an integer tick count.
+# X steps 16 entries/tick (~0.1 rad), Y 11 entries/tick (~0.7x) from a cos offset
+SINE_LUT_SIZE = 1024
+_SINE_MASK = SINE_LUT_SIZE - 1
+_SINE_LUT = np.sin(
+    np.linspace(0, 2 * np.pi, SINE_LUT_SIZE, endpoint=False, dtype=np.float32)
+)
+
+
+def _anim_step(
+    cr, cg, cb, tr, tg, tb, cur_x, cur_y, tgt_x, tgt_y, speed, phase, amp, snap
+):
+    """One animation tick: colour lerp plus position lerp with sine breathing."""
+    # Integer 1/10 step; floor division matches int() of the old float lerp
+    r = cr + (tr - cr) // 10
+    g = cg + (tg - cg) // 10
+    b = cb + (tb - cb) // 10
+    if snap:
+        # Spinozan snap (instant)
+        return r, g, b, tgt_x, tgt_y, phase
+    phase = (phase + 1) & _SINE_MASK
+    sine_x = float(_SINE_LUT[(phase * 16) & _SINE_MASK]) * amp
+    sine_y = float(_SINE_LUT[(phase * 11 + SINE_LUT_SIZE // 4) & _SINE_MASK]) * amp
+    new_x = int(cur_x + (tgt_x - cur_x) * speed + sine_x)
+    new_y = int(cur_y + (tgt_y - cur_y) * speed + sine_y)
+    return r, g, b, new_x, new_y, phase
+
+
+if NUMBA_AVAILABLE:
+    _anim_step = njit(cache=True, fastmath=True)(_anim_step)
+
+
+def _warm_anim_step():
+    """Compile (or load the cached) kernel off the GUI thread."""
+    _anim_step(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.06, 0, 0.0, False)
+
 
 class CognitiveWorker(QObject):
     """Background thread for cognitive processing"""
@@ -36,21 +105,28 @@ class CognitiveWorker(QObject):
         self.controller = controller
         self.running = True
         self.last_pos = QPoint(0, 0)
-        self.last_time = 0
+        self.last_time_ns = 0
+        self.last_emerge_ns = 0
 
+    @Slot(QPoint)
     def process_cursor(self, pos):
         if not self.running:
             return
 
-        # Calculate velocity
-        current_time = os.times().system
+        # Calculate velocity (monotonic wall time; os.times() was CPU time)
+        now_ns = time.perf_counter_ns()
         dx = pos.x() - self.last_pos.x()
         dy = pos.y() - self.last_pos.y()
-        dt = current_time - self.last_time if self.last_time > 0 else 0.016
-        velocity = math.sqrt(dx * dx + dy * dy) / max(dt, 0.001)
+        if (
+            abs(dx) + abs(dy) < CURSOR_MOVE_THRESHOLD_PX
+            and now_ns - self.last_emerge_ns < COGNITION_HEARTBEAT_NS
+        ):
+            return
+        dt = (now_ns - self.last_time_ns) * 1e-9 if self.last_time_ns else 0.016
+        velocity = math.hypot(dx, dy) / max(dt, 0.001)
 
         self.last_pos = pos
-        self.last_time = current_time
+        self.last_time_ns = now_ns
 
         stimulus = {
             "type": "cursor_movement",
@@ -59,12 +135,23 @@ class CognitiveWorker(QObject):
             "intent": "navigation",
         }
 
+        self.last_emerge_ns = now_ns
         thought = self.controller.cognitively_emerge(stimulus)
-        if thought:
+        # Lightning bypass returns a vault record dict, not a thought; no pulse
+        if thought and not isinstance(thought, dict):
             self.pulse_signal.emit(thought.pulse())
 
 
 class FloatingOrb(QWidget):
+    # Queued across threads, so cognition runs on worker_thread, not the GUI
+    cursor_request = Signal(QPoint)
+
+    # Hysteresis band (release 650 -> trigger 800 of 1000) in Qt 1/16 degrees
+    BAND_TRIGGER, BAND_RELEASE = 800, 650
+    _BAND_RECT = (10, 10, 100, 100)
+    _BAND_START16 = int((90 - BAND_RELEASE / 1000.0 * 360.0) * 16)
+    _BAND_SPAN16 = -int((BAND_TRIGGER - BAND_RELEASE) / 1000.0 * 360.0 * 16)
+
     def __init__(self):
         super().__init__()
         self.controller = SF_ORB_Controller()
@@ -78,11 +165,12 @@ class FloatingOrb(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
-        self.setFixedSize(120, 120)
+        self.setFixedSize(120 + 2 * ORB_PAD, 120 + 2 * ORB_PAD)
 
-        # Position
-        screen = QApplication.primaryScreen().geometry()
-        self.move(screen.center() - self.rect().center())
+        # Position (screen bounds are cached; refreshed on screenChanged)
+        self._screen_signal_connected = False
+        self._refresh_screen(QApplication.primaryScreen())
+        self.move(self._screen_rect.center() - self.rect().center())
 
         # State
         self.current_pos = self.pos()
@@ -99,13 +187,17 @@ class FloatingOrb(QWidget):
         self.edge_cutter_active = False
         self.purge_phase = 0
         self.proc_time_ms = 0.0
-        self.latency_samples = deque(maxlen=40)
+        # Ring buffer: next write at _latency_head, streaming max of live samples
+        self.latency_samples = np.zeros(SPARKLINE_SAMPLES, dtype=np.float32)
+        self._latency_head = 0
+        self._latency_count = 0
+        self._latency_max = 0.0
 
         # Gravity / Proprioception
         self.gravity_field = EpistemicGravityField2D()
         self.gravity_pressure = 0.0
         self.nav_vector = None  # [x, y] from controller
-        self.sine_phase = 0.0  # Phase for sine-based jitter
+        self.sine_phase = 0  # _SINE_LUT tick index for sine-based jitter
 
         # Mode colors
         self.colors = {
@@ -114,7 +206,12 @@ class FloatingOrb(QWidget):
             "HABIT": QColor(255, 191, 0),  # Amber
             "INTUITION-JUMP": QColor(143, 0, 255),  # Violet
         }
+        # Raw (r, g, b) ints for the per-tick lerp; QColor only built on change
+        self._mode_rgb = {
+            mode: (c.red(), c.green(), c.blue()) for mode, c in self.colors.items()
+        }
         self.current_color = self.colors["GUARD"]
+        self._cur_rgb = self._mode_rgb["GUARD"]
         self.pulse_phase = 0
 
         # Setup worker thread
@@ -122,33 +219,47 @@ class FloatingOrb(QWidget):
         self.worker = CognitiveWorker(self.controller)
         self.worker.moveToThread(self.worker_thread)
         self.worker.pulse_signal.connect(self.handle_pulse)
+        self.cursor_request.connect(self.worker.process_cursor)
 
-        # Timers
-        self.track_timer = QTimer()
-        self.track_timer.timeout.connect(self.track_cursor)
-        self.track_timer.start(16)  # 60fps tracking
+        # Single 60fps master tick: tracking + animation every tick, cognition
+        # every COGNITION_EVERY_N_TICKS (~10Hz), and at most one repaint
+        self._tick = 0
+        self._dirty = True
+        self._latency_run = 0  # trailing count of identical latency samples
+        self._idle = False  # animation settled; skipped until the next pulse
+        self.master_timer = QTimer()
+        self.master_timer.timeout.connect(self._on_tick)
+        self.master_timer.start(16)
 
-        self.anim_timer = QTimer()
-        self.anim_timer.timeout.connect(self.update_animation)
-        self.anim_timer.start(16)
-
-        self.cognitive_timer = QTimer()
-        self.cognitive_timer.timeout.connect(self.process_cognition)
-        self.cognitive_timer.start(100)  # 10Hz cognition
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=_warm_anim_step, daemon=True).start()
 
         self.last_cursor = QCursor.pos()
         self.setup_ui()
-        self.worker_thread.start()
+        # Cognition yields to the GUI thread so paint ticks don't jitter
+        self.worker_thread.start(QThread.Priority.LowPriority)
 
     def setup_ui(self):
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(30)
-        self.shadow.setColor(self.current_color)
-        self.shadow.setOffset(0, 0)
-        self.setGraphicsEffect(self.shadow)
+        # Paint objects that never change, built once
+        self._core_brush = QBrush(QColor(255, 255, 255, 100))
+        self._density_pen = QPen(QColor(0, 200, 200), 4)
+        self._band_pen = QPen(QColor(120, 220, 120, 180), 3)
+        self._spark_pen = QPen(QColor(255, 90, 90), 2)
+        self._habit_pen = QPen(self.colors["HABIT"], 3)
+        # Sparkline polygon reused across paints; points are overwritten in place
+        self._spark_poly = QPolygonF()
+        self._spark_xs = []
+        self._rebuild_orb_brush()
+
+        # Mode-specialised painters; handle_pulse rebinds _paint_impl on a mode change
+        self._paint_table = {
+            "HABIT": self._paint_habit,
+            "INTUITION-JUMP": self._paint_jump,
+        }
+        self._paint_impl = self._paint_guard
 
         self.hud = QLabel(self)
-        self.hud.setGeometry(10, 45, 100, 30)
+        self.hud.setGeometry(10 + ORB_PAD, 45 + ORB_PAD, 100, 30)
         self.hud.setStyleSheet("""
             color: white; 
             background: rgba(0,0,0,0.7); 
@@ -161,24 +272,82 @@ class FloatingOrb(QWidget):
         self.hud.setText("GUARD")
         self.hud.hide()
 
+    def _rebuild_orb_brush(self):
+        """Rebuild the orb and glow-halo gradient brushes from current_color."""
+        color = self.current_color
+        gradient = QRadialGradient(60, 60, 50)
+        gradient.setColorAt(0, color.lighter(150))
+        gradient.setColorAt(0.7, color)
+        gradient.setColorAt(1, color.darker(120))
+        self._orb_brush = QBrush(gradient)
+        self._orb_rgb = (color.red(), color.green(), color.blue())
+
+        # Glow halo: solid under the body (r=50), fading out to the widget edge
+        glow = QColor(color)
+        glow.setAlpha(max(0, min(int(160 * self.glow_intensity), 255)))
+        halo = QRadialGradient(60, 60, 60 + ORB_PAD)
+        halo.setColorAt(0, glow)
+        halo.setColorAt(50 / (60 + ORB_PAD), glow)
+        glow.setAlpha(0)
+        halo.setColorAt(1, glow)
+        self._halo_brush = QBrush(halo)
+        self._halo_glow = self.glow_intensity
+
+    def _refresh_screen(self, screen):
+        """Cache the screen rect and the orb's clamp bounds for it."""
+        rect = screen.geometry()
+        self._screen_rect = rect
+        margin = 20
+        # Orb size is 120x120 approx; the widget adds ORB_PAD of halo per side
+        self._min_x = rect.left() + margin - ORB_PAD
+        self._max_x = rect.right() - 120 - margin - ORB_PAD
+        self._min_y = rect.top() + margin - ORB_PAD
+        self._max_y = rect.bottom() - 120 - margin - ORB_PAD
+
+    def showEvent(self, event):
+        # The native window (and its screenChanged signal) exists once shown
+        if not self._screen_signal_connected:
+            self.windowHandle().screenChanged.connect(self._refresh_screen)
+            self._screen_signal_connected = True
+        super().showEvent(event)
+
+    def _on_tick(self):
+        self.track_cursor()
+        if not self._idle:
+            self.update_animation()
+        if self._tick % COGNITION_EVERY_N_TICKS == 0:
+            self.process_cognition()
+        self._tick += 1
+        if self._dirty:
+            self._dirty = False
+            self.update()
+
     def track_cursor(self):
         self.last_cursor = QCursor.pos()
 
     def process_cognition(self):
         if self.worker_thread.isRunning():
-            self.worker.process_cursor(self.last_cursor)
+            self.cursor_request.emit(self.last_cursor)
 
     def handle_pulse(self, pulse):
         mode = pulse.get("cognitive_mode", "GUARD")
         self.cognitive_mode = mode
+        self._paint_impl = self._paint_table.get(mode, self._paint_guard)
         self.glow_intensity = pulse.get("glow_intensity", 0.5)
+        if self.glow_intensity != self._halo_glow:
+            self._rebuild_orb_brush()
         self.field_density = pulse.get("field_density", 0)
         self.proc_time_ms = pulse.get("proc_time_ms", 0.0)
         self.edge_cutter_active = pulse.get("edge_cutter_active", False)
 
         # Update Epistemic Gravity Field
-        gravity_stats = pulse.get("gravity_stats", {})
-        self.gravity_pressure = self.gravity_field.update_from_pulse(gravity_stats)
+        # Skip the field tick for empty stats once any earlier pressure has
+        # decayed below the jitter threshold (nothing left to animate)
+        gravity_stats = pulse.get("gravity_stats")
+        if gravity_stats or self.gravity_pressure > 0.001:
+            self.gravity_pressure = self.gravity_field.update_from_pulse(
+                gravity_stats or {}
+            )
         self.nav_vector = pulse.get("navigation_vector", None)
 
         # Handle Humean prediction
@@ -203,11 +372,10 @@ class FloatingOrb(QWidget):
         if mode == "INTUITION-JUMP":
             jump_vec = pulse.get("jump_vector", [0, 0])
             if jump_vec and abs(jump_vec[0]) > 0.01:
-                screen = QApplication.primaryScreen().geometry()
-                center = screen.center()
+                center = self._screen_rect.center()
                 # Map normalized vector to screen space (200px range)
-                target_x = center.x() + jump_vec[0] * 200 - 60
-                target_y = center.y() + jump_vec[1] * 200 - 60
+                target_x = center.x() + jump_vec[0] * 200 - 60 - ORB_PAD
+                target_y = center.y() + jump_vec[1] * 200 - 60 - ORB_PAD
                 self.target_pos = QPoint(int(target_x), int(target_y))
                 self.jump_active = True
             self.pulse_phase = 0  # Reset pulse for shockwave
@@ -217,95 +385,74 @@ class FloatingOrb(QWidget):
             if self.nav_vector:
                 # Clamp nav_vector magnitude to avoid wild swings
                 vx, vy = self.nav_vector[0], self.nav_vector[1]
-                mag = math.sqrt(vx * vx + vy * vy)
-                max_speed = 3.0  # Cap the push from the field
-                if mag > max_speed:
-                    scale = max_speed / mag
+                # Compare squared magnitude so a calm field never pays the sqrt
+                mag_sq = vx * vx + vy * vy
+                if mag_sq > NAV_MAX_SPEED * NAV_MAX_SPEED:
+                    scale = NAV_MAX_SPEED / math.sqrt(mag_sq)
                     vx *= scale
                     vy *= scale
 
                 # Apply vector to current position to find target
                 # Logic: target = current + vec * 40 (pixels lookahead)
-                target_offset = QPoint(int(vx * 40), int(vy * 40))
-                raw_target = self.current_pos + target_offset
+                tx = self.current_pos.x() + int(vx * 40)
+                ty = self.current_pos.y() + int(vy * 40)
             else:
                 # Classic behavior: follow cursor with prediction
-                # Anchor: Top-Left (pos) is cursor - (60,60) to center orb on cursor
-                raw_target = self.last_cursor + self.predictive_offset - QPoint(60, 60)
+                # Anchor: Top-Left (pos) is cursor - (80,80) to center orb on cursor
+                tx = self.last_cursor.x() + self.predictive_offset.x() - 60 - ORB_PAD
+                ty = self.last_cursor.y() + self.predictive_offset.y() - 60 - ORB_PAD
 
-            # Screen Clamping with Margin
-            screen = QApplication.primaryScreen().geometry()
-            margin = 20
-            # Orb size is 120x120 approx
-            min_x = screen.left() + margin
-            max_x = screen.right() - 120 - margin
-            min_y = screen.top() + margin
-            max_y = screen.bottom() - 120 - margin
+            # Screen Clamping with Margin (plain ints; one QPoint at the end)
+            tx = max(self._min_x, min(tx, self._max_x))
+            ty = max(self._min_y, min(ty, self._max_y))
 
-            clamped_x = max(min_x, min(raw_target.x(), max_x))
-            clamped_y = max(min_y, min(raw_target.y(), max_y))
-
-            self.target_pos = QPoint(int(clamped_x), int(clamped_y))
+            self.target_pos = QPoint(tx, ty)
 
         self.hud.setText(f"{mode}\n{self.glow_intensity:.2f}")
-        self.update()
+        self._dirty = True
+        self._idle = False
 
     def update_animation(self):
-        # Color lerp
-        target_color = self.colors.get(self.cognitive_mode, self.colors["GUARD"])
-        r = (
-            self.current_color.red()
-            + (target_color.red() - self.current_color.red()) * 0.1
-        )
-        g = (
-            self.current_color.green()
-            + (target_color.green() - self.current_color.green()) * 0.1
-        )
-        b = (
-            self.current_color.blue()
-            + (target_color.blue() - self.current_color.blue()) * 0.1
-        )
-        self.current_color = QColor(int(r), int(g), int(b))
-
-        # Shadow/glow
-        self.shadow.setColor(self.current_color)
-        base_blur = 20
-        blur = base_blur + (60 * self.glow_intensity)
-        self.shadow.setBlurRadius(int(blur))
-
-        # Position handling
-        if self.jump_active:
-            # Spinozan snap (instant)
-            self.current_pos = self.target_pos
-        else:
-            # Smoother lerp for stability
-            if self.cognitive_mode == "HABIT":
-                speed = 0.12  # Slightly reduced for stability
-            else:
-                speed = 0.06  # Very smooth following
-
-            # Sine-based "breathing" noise instead of random jitter
-            self.sine_phase += 0.1
-            noise_amp = 0
-            if self.gravity_pressure > 0.001:
-                # Pressure controls amplitude of the sine wave
-                noise_amp = self.gravity_pressure * 5.0  # pixels
-
-            sine_x = math.sin(self.sine_phase) * noise_amp
-            sine_y = math.cos(self.sine_phase * 0.7) * noise_amp
-
-            new_x = (
-                self.current_pos.x()
-                + (self.target_pos.x() - self.current_pos.x()) * speed
-                + sine_x
-            )
-            new_y = (
-                self.current_pos.y()
-                + (self.target_pos.y() - self.current_pos.y()) * speed
-                + sine_y
-            )
+        prev_rgb = self._cur_rgb
+        prev_pos = self.current_pos
 
-            self.current_pos = QPoint(int(new_x), int(new_y))
+        # Smoother lerp for stability
+        if self.cognitive_mode == "HABIT":
+            speed = 0.12  # Slightly reduced for stability
+        else:
+            speed = 0.06  # Very smooth following
+
+        # Sine-based "breathing" noise instead of random jitter
+        noise_amp = 0.0
+        if self.gravity_pressure > 0.001:
+            # Pressure controls amplitude of the sine wave
+            noise_amp = self.gravity_pressure * 5.0  # pixels
+
+        target_rgb = self._mode_rgb.get(self.cognitive_mode, self._mode_rgb["GUARD"])
+        r, g, b, new_x, new_y, self.sine_phase = _anim_step(
+            *prev_rgb,
+            *target_rgb,
+            self.current_pos.x(),
+            self.current_pos.y(),
+            self.target_pos.x(),
+            self.target_pos.y(),
+            speed,
+            self.sine_phase,
+            noise_amp,
+            self.jump_active,
+        )
+        self._cur_rgb = (r, g, b)
+        color_changed = self._cur_rgb != prev_rgb
+        if color_changed:
+            self.current_color = QColor(r, g, b)
+        self.current_pos = QPoint(new_x, new_y)
+
+        # Rebuild the gradient on a visible step, or once the lerp settles
+        orb_r, orb_g, orb_b = self._orb_rgb
+        if self._cur_rgb != self._orb_rgb and (
+            max(abs(r - orb_r), abs(g - orb_g), abs(b - orb_b)) > 4 or not color_changed
+        ):
+            self._rebuild_orb_brush()
 
         self.move(self.current_pos)
 
@@ -319,13 +466,51 @@ class FloatingOrb(QWidget):
             self.purge_phase = max(self.purge_phase - 4, 0)
 
         # Track latency samples for sparkline
-        self.latency_samples.append(float(self.proc_time_ms))
-
-        self.update()
+        sample = np.float32(self.proc_time_ms)
+        samples = self.latency_samples
+        head = self._latency_head
+        if self._latency_count and samples[head - 1] == sample:
+            self._latency_run += 1
+        else:
+            self._latency_run = 1
+        evicted = samples[head]
+        samples[head] = sample
+        self._latency_head = (head + 1) % SPARKLINE_SAMPLES
+        self._latency_count = min(self._latency_count + 1, SPARKLINE_SAMPLES)
+        # Rescan only when the evicted sample may have been the max
+        if evicted >= self._latency_max:
+            self._latency_max = float(samples.max())
+        elif sample > self._latency_max:
+            self._latency_max = float(sample)
+
+        # Repaint only when something visible changed this tick
+        if (
+            color_changed
+            or self.current_pos != prev_pos
+            or self.pulse_phase
+            or self.purge_phase
+            or self._latency_run < SPARKLINE_SAMPLES
+        ):
+            self._dirty = True
+        elif (
+            self.gravity_pressure <= 0.001
+            and self.cognitive_mode != "INTUITION-JUMP"
+            and not self.edge_cutter_active
+        ):
+            # Nothing moves until handle_pulse changes state again
+            self._idle = True
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Orb geometry below is in body coordinates (0..120); halo fills the pad
+        painter.translate(ORB_PAD, ORB_PAD)
+
+        # Glow halo, painted directly (a QGraphicsDropShadowEffect would
+        # software-blur the whole widget on every repaint)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._halo_brush)
+        painter.drawEllipse(-ORB_PAD, -ORB_PAD, 120 + 2 * ORB_PAD, 120 + 2 * ORB_PAD)
 
         # Purge shockwave effect when edge-cutter is active
         if self.purge_phase > 0:
@@ -338,77 +523,96 @@ class FloatingOrb(QWidget):
                 int(60 - radius / 2), int(60 - radius / 2), int(radius), int(radius)
             )
 
-        # Shockwave effect for Intuition-Jump
-        if self.cognitive_mode == "INTUITION-JUMP" and self.pulse_phase > 0:
-            alpha = int(255 * (1 - self.pulse_phase / 30))
-            pulse_color = QColor(
-                self.current_color.red(),
-                self.current_color.green(),
-                self.current_color.blue(),
-                alpha,
-            )
-            painter.setBrush(QBrush(pulse_color))
+        self._paint_impl(painter)
+
+        # Gravity Entropy Field visualization (Subtle background distortion)
+        if self.gravity_pressure > 0.01:
             painter.setPen(Qt.PenStyle.NoPen)
-            radius = 60 + self.pulse_phase * 3
-            painter.drawEllipse(
-                int(60 - radius / 2), int(60 - radius / 2), radius, radius
-            )
+            painter.setBrush(QBrush(QColor(255, 0, 0, int(self.gravity_pressure * 30))))
+            painter.drawEllipse(50, 50, 20, 20)  # Red dot in center if high entropy
 
+    def _paint_common(self, painter):
+        """Orb body, density/band arcs and latency sparkline (every mode)."""
         # Main orb with gradient
-        gradient = QRadialGradient(60, 60, 50)
-        gradient.setColorAt(0, self.current_color.lighter(150))
-        gradient.setColorAt(0.7, self.current_color)
-        gradient.setColorAt(1, self.current_color.darker(120))
-
-        painter.setBrush(QBrush(gradient))
+        painter.setBrush(self._orb_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(10, 10, 100, 100)
 
         # Inner core
-        painter.setBrush(QBrush(QColor(255, 255, 255, 100)))
+        painter.setBrush(self._core_brush)
         painter.drawEllipse(30, 30, 60, 60)
 
+        # Thin arcs and the sparkline are drawn aliased (AA is ~4x the per-pixel
+        # cost in the raster engine for little visible gain at these widths)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+
         # Density ring (maps 0-1000 to arc) and hysteresis band (650-800)
         density_ratio = min(max(self.field_density / 1000.0, 0.0), 1.0)
-        painter.setPen(QPen(QColor(0, 200, 200), 4))
+        painter.setPen(self._density_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawArc(6, 6, 108, 108, 90 * 16, -int(density_ratio * 360 * 16))
 
-        trigger, release = 800, 650
-        band_start = release / 1000.0 * 360.0
-        band_span = (trigger - release) / 1000.0 * 360.0
-        painter.setPen(QPen(QColor(120, 220, 120, 180), 3))
-        painter.drawArc(
-            10, 10, 100, 100, int((90 - band_start) * 16), -int(band_span * 16)
-        )
+        painter.setPen(self._band_pen)
+        painter.drawArc(*self._BAND_RECT, self._BAND_START16, self._BAND_SPAN16)
 
         # Latency sparkline (bottom area)
-        if self.latency_samples:
-            samples = list(self.latency_samples)
-            max_latency = max(max(samples), 1.0)
+        n = self._latency_count
+        if n:
+            ring = self.latency_samples
+            head = self._latency_head
+            if n < SPARKLINE_SAMPLES:
+                samples = ring[:n]
+            else:
+                samples = np.concatenate((ring[head:], ring[:head]))
+            max_latency = max(self._latency_max, 1.0)
             w = 80
             h = 30
             x0 = 20
             y0 = 90
-            pts = []
-            for i, val in enumerate(samples):
-                x = x0 + (i / max(1, len(samples) - 1)) * w
-                y = y0 + h - min(h, (val / max_latency) * h)
-                pts.append(QPointF(x, y))
-            painter.setPen(QPen(QColor(255, 90, 90), 2))
-            painter.drawPolyline(pts)
+            if len(self._spark_xs) != n:
+                # Only changes while the history fills; then it's fixed
+                self._spark_xs = np.linspace(x0, x0 + w, n).tolist()
+            xs = self._spark_xs
+            ys = y0 + h - np.minimum(h, samples * (h / max_latency))
+            poly = self._spark_poly
+            if poly.size() != n:
+                poly.resize(n)
+            for i, (x, y) in enumerate(zip(xs, ys.tolist())):
+                poly[i] = QPointF(x, y)
+            painter.setPen(self._spark_pen)
+            painter.drawPolyline(poly)
+
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+    def _paint_guard(self, painter):
+        self._paint_common(painter)
+
+    def _paint_habit(self, painter):
+        self._paint_common(painter)
 
         # Mode indicator ring
-        if self.cognitive_mode == "HABIT":
-            painter.setPen(QPen(self.colors["HABIT"], 3))
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawEllipse(5, 5, 110, 110)
+        painter.setPen(self._habit_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(5, 5, 110, 110)
 
-        # Gravity Entropy Field visualization (Subtle background distortion)
-        if self.gravity_pressure > 0.01:
+    def _paint_jump(self, painter):
+        # Shockwave effect for Intuition-Jump
+        if self.pulse_phase > 0:
+            alpha = int(255 * (1 - self.pulse_phase / 30))
+            pulse_color = QColor(
+                self.current_color.red(),
+                self.current_color.green(),
+                self.current_color.blue(),
+                alpha,
+            )
+            painter.setBrush(QBrush(pulse_color))
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(QColor(255, 0, 0, int(self.gravity_pressure * 30))))
-            painter.drawEllipse(50, 50, 20, 20)  # Red dot in center if high entropy
+            radius = 60 + self.pulse_phase * 3
+            painter.drawEllipse(
+                int(60 - radius / 2), int(60 - radius / 2), radius, radius
+            )
+
+        self._paint_common(painter)
 
     def enterEvent(self, event):
         self.hud.show()
@@ -1,10 +1,11 @@
 import time
 import sys
 import json
-import math
 import hashlib
+import functools
 from pathlib import Path
-from collections import deque
+
+import numpy as np
 from hlsf_geometry.engine import hlsf_singleton
 from components.core_4_minds.tribunal import FourMindTribunal
 from vault_system.manager import VaultManager
@@ -16,58 +17,111 @@ if str(PARENT) not in sys.path:
 
 from bayesian_engine import BayesianEngine
 
-# --- Epistemic Gravity Wiring ---
+# Optional JIT for the per-stimulus navigation kernel
 try:
-    EGF_PATH = PARENT / "Epistemic_Gravity_Field"
-    if str(EGF_PATH) not in sys.path:
-        sys.path.append(str(EGF_PATH))
-    from space_field import SpaceFieldCognition
-    import torch
+    from numba import njit
 
-    TORCH_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Epistemic Gravity Field not loaded: {e}")
-    TORCH_AVAILABLE = False
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# --- Epistemic Gravity Wiring ---
+EGF_PATH = PARENT / "Epistemic_Gravity_Field"
 
 
 class EpistemicGravityBridge:
+    # (torch, SpaceFieldCognition) once imported, False if unavailable; torch
+    # is only imported when the first bridge is built
+    _lazy_loaded = None
+
+    @classmethod
+    def _load_backend(cls):
+        if cls._lazy_loaded is None:
+            try:
+                if str(EGF_PATH) not in sys.path:
+                    sys.path.append(str(EGF_PATH))
+                from space_field import SpaceFieldCognition
+                import torch
+
+                cls._lazy_loaded = (torch, SpaceFieldCognition)
+            except ImportError as e:
+                print(f"Warning: Epistemic Gravity Field not loaded: {e}")
+                cls._lazy_loaded = False
+        return cls._lazy_loaded
+
     def __init__(self):
-        self.active = TORCH_AVAILABLE
+        backend = self._load_backend()
+        self.active = bool(backend)
         if self.active:
+            torch, SpaceFieldCognition = backend
+            self._torch = torch
             print("Wiring Epistemic Gravity Field...")
-            self.field = SpaceFieldCognition(device="cpu")
+            # On a GPU the field update runs on a side stream so it overlaps
+            # the tribunal work; collect() synchronizes before stats are read
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self._stream = torch.cuda.Stream() if device == "cuda" else None
+            self.field = SpaceFieldCognition(device=device)
             self.dim = self.field.config.DIM
+            # 1920x1080 reference screen to DIM x DIM grid, injected at mid z
+            self._sx = (self.dim - 1) / 1920.0
+            self._sy = (self.dim - 1) / 1080.0
+            self._zmid = self.dim // 2
+            # Reused injection tensor; only the last injected voxel is non-zero
+            self._inject_buf = torch.zeros(
+                self.dim, self.dim, self.dim, 4, device=device
+            )
+            self._last_ijk = None
             print("✓ Epistemic Gravity Online (32³ Tensor)")
 
     def process_stimulus(self, stimulus):
+        self.submit(stimulus)
+        return self.collect()
+
+    def submit(self, stimulus):
+        """Queue the field step and stimulus injection (async on CUDA)."""
+        if not self.active:
+            return
+        if self._stream is None:
+            self._advance(stimulus)
+            return
+        with self._torch.cuda.stream(self._stream):
+            self._advance(stimulus)
+
+    def collect(self):
+        """Wait for the submitted field update and return its stats."""
         if not self.active:
             return {}
+        if self._stream is not None:
+            self._stream.synchronize()
+        return self.field.get_field_stats()
 
+    def _advance(self, stimulus):
         self.field.step()
 
         if stimulus.get("type") == "cursor_movement":
             coords = stimulus.get("coordinates", [0, 0])
-            # Mapping 1920x1080 to DIM x DIM
-            x = int((coords[0] / 1920.0) * (self.dim - 1))
-            y = int((coords[1] / 1080.0) * (self.dim - 1))
+            x = int(coords[0] * self._sx)
+            y = int(coords[1] * self._sy)
             x = max(0, min(x, self.dim - 1))
             y = max(0, min(y, self.dim - 1))
 
-            # Create injection tensor
-            signal = torch.zeros(self.dim, self.dim, self.dim, 4)
-            # Inject at center z-plane
-            z = self.dim // 2
+            # Reset the previous voxel instead of allocating a fresh dense tensor
+            signal = self._inject_buf
+            if self._last_ijk is not None:
+                signal[self._last_ijk] = 0.0
+            z = self._zmid
 
             # Simple intensity based on velocity or default
             intensity = min(stimulus.get("velocity", 1.0) / 10.0, 1.0)
             signal[x, y, z, :] = intensity
+            self._last_ijk = (x, y, z)
 
             self.field.broadcast_to_field(signal)
 
-        return self.field.get_field_stats()
-
 
 # --------------------------------
+# Predicate attributes attached after synthesis and surfaced in pulse()
+_PULSE_OPTIONAL_ATTRS = ("navigation_vector", "final_verdict", "final_verdict_source")
 
 
 class CrossDomainPredicate:
@@ -79,6 +133,11 @@ class CrossDomainPredicate:
         self.logic_validity = logic
         self.confidence = synthesis_confidence
         self.timestamp = time.time()
+        # Traces are fixed once synthesized, so the alignment is computed once
+        confidences = [
+            trace.get("confidence", 0.5) for trace in (epistemic or {}).values()
+        ]
+        self._alignment = sum(confidences) / len(confidences) if confidences else 0.0
 
     def pulse(self):
         mode = self.logic_validity.get("active_mode") or (
@@ -89,16 +148,36 @@ class CrossDomainPredicate:
         result = {
             "glow_intensity": self.confidence,
             "cognitive_mode": mode,
-            "spatial_coordinate": self.hlsf_node,
-            "epistemic_alignment": self._calculate_axiomatic_alignment(),
-            "deterministic": self.confidence > 0.95,
-            "predictive_intent": self.logic_validity.get("inductive_prediction", {}),
-            "jump_vector": self.logic_validity.get("necessity_vector", []),
-            "navigation_vector": getattr(self, "navigation_vector", None),
-            "final_verdict": getattr(self, "final_verdict", None),
-            "final_verdict_source": getattr(self, "final_verdict_source", None),
         }
-        return {k: v for k, v in result.items() if v is not None}
+        # None-valued fields are left out rather than filtered afterwards
+        if self.hlsf_node is not None:
+            result["spatial_coordinate"] = self.spatial_coordinate
+        result["epistemic_alignment"] = self._alignment
+        result["deterministic"] = self.confidence > 0.95
+        predictive_intent = self.logic_validity.get("inductive_prediction", {})
+        if predictive_intent is not None:
+            result["predictive_intent"] = predictive_intent
+        jump_vector = self.logic_validity.get("necessity_vector", [])
+        if jump_vector is not None:
+            result["jump_vector"] = jump_vector
+        for key in _PULSE_OPTIONAL_ATTRS:
+            value = getattr(self, key, None)
+            if value is not None:
+                result[key] = value
+        return result
+
+    @property
+    def spatial_coordinate(self):
+        """HLSF node summary, built from the node only when requested."""
+        node = self.hlsf_node
+        if node is None:
+            return None
+        return {
+            "node_id": f"NODE_{node.n}_{node.k}",
+            "recursion_depth": node.k,
+            "coordinates": node.coordinates,
+            "adjacency_value": node.adjacency_value,
+        }
 
     def internal_state(self):
         return {
@@ -107,12 +186,90 @@ class CrossDomainPredicate:
         }
 
     def _calculate_axiomatic_alignment(self):
-        if not self.epistemic_traces:
-            return 0.0
-        confidences = [
-            trace.get("confidence", 0.5) for trace in self.epistemic_traces.values()
-        ]
-        return sum(confidences) / len(confidences)
+        return self._alignment
+
+
+def _nav_kernel(px, py, cx, cy, min_d, target_d, heat, jx, jy, gravity):
+    """Navigation desire vector from orb (px, py) toward/away from cursor (cx, cy)."""
+    # Vector to cursor
+    dx = cx - px
+    dy = cy - py
+    dist = (dx * dx + dy * dy) ** 0.5
+    if dist == 0.0:
+        return 0.0, 0.0
+
+    # 1. Attract/Repel Cursor (Goldilocks Zone)
+    # If too far, attract. If too close, repel strongly.
+    force_mag = 0.0
+    if dist < min_d:
+        # Strong repulsion
+        force_mag = -1.0 * (min_d - dist) / min_d
+    elif dist > target_d:
+        # Gentle attraction
+        force_mag = 0.5 * (dist - target_d) / 1000.0
+
+    # Base vector
+    nx = dx / dist
+    ny = dy / dist
+    vx = nx * force_mag
+    vy = ny * force_mag
+
+    # 2. Habit Avoidance (Traffic): jitter pre-scaled by the caller
+    if heat > 0.5:
+        vx += jx
+        vy += jy
+
+    # 3. Epistemic Gravity Repulsion (High Entropy/Density): push away further
+    if gravity > 0.0:
+        vx -= nx * gravity * 0.5
+        vy -= ny * gravity * 0.5
+    return vx, vy
+
+
+if NUMBA_AVAILABLE:
+    _nav_kernel = njit(cache=True, fastmath=True)(_nav_kernel)
+
+
+# Shared generator for navigation jitter (one draw per call, no per-call import)
+_RNG = np.random.default_rng()
+
+# JSON scalars a stimulus may hold (directly or in a flat list) to be memoized
+_CANONICAL_SCALARS = (str, int, float, bool, type(None))
+
+
+def _freeze_stimulus(stimulus):
+    """Hashable, type-tagged key for a flat stimulus dict; None if not flat."""
+    items = []
+    for key, value in stimulus.items():
+        kind = type(value)
+        if kind is list or kind is tuple:
+            for item in value:
+                if type(item) not in _CANONICAL_SCALARS:
+                    return None
+            value = tuple((type(item), item) for item in value)
+        elif kind not in _CANONICAL_SCALARS:
+            return None
+        items.append((key, kind, value))
+    return tuple(items)
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_stimulus(frozen):
+    """Sorted-key JSON for a frozen stimulus (tuples render as JSON arrays)."""
+    stimulus = {
+        key: [item for _, item in value] if kind is list or kind is tuple else value
+        for key, kind, value in frozen
+    }
+    return json.dumps(stimulus, sort_keys=True, default=str)
+
+
+# Stimulus types rejected unless explicitly flagged as test traffic
+_BLOCKED_STIMULUS_TYPES = frozenset({"surveillance_probe"})
+
+# Screen quadrants in row-major order (row = bottom half, col = right half)
+_QUADRANTS = ("NW", "NE", "SW", "SE")
+HABIT_WINDOW = 5
+_HABIT_RING_MASK = (1 << (2 * HABIT_WINDOW)) - 1
 
 
 class HabitTracker:
@@ -122,33 +279,32 @@ class HabitTracker:
         self.vault = vault_manager
         if not hasattr(self.vault, "posteriori_cache"):
             self.vault.posteriori_cache = {}
-        self.sequence_buffer = deque(maxlen=5)
+        # Bound once; the vault updates this dict in place on crystallize
+        self._posteriori = self.vault.posteriori_cache
+        # Last HABIT_WINDOW quadrant codes packed 2 bits each, newest lowest
+        self._qring = 0
+        self._qlen = 0
         self.pattern_cache = {}
+        # Running sum of pattern counts per quadrant the pattern touches
+        self._quadrant_totals = {quadrant: 0 for quadrant in _QUADRANTS}
 
     def record_observation(self, stimulus):
         if stimulus.get("type") != "cursor_movement":
             return None
         coords = stimulus.get("coordinates", [0, 0])
-        quadrant = self._coords_to_quadrant(coords)
-        observation = {
-            "quadrant": quadrant,
-            "coords": coords,
-            "velocity": stimulus.get("velocity", 0.0),
-            "timestamp": time.time(),
-        }
-        self.sequence_buffer.append(observation)
-        if len(self.sequence_buffer) >= 3:
-            pattern_key = self._serialize_pattern(list(self.sequence_buffer))
-            self._update_conjunction_frequency(pattern_key)
-        return observation
+        code = self._coords_to_code(coords)
+        self._qring = ((self._qring << 2) | code) & _HABIT_RING_MASK
+        if self._qlen < HABIT_WINDOW:
+            self._qlen += 1
+        if self._qlen >= 3:
+            self._update_conjunction_frequency(self._pattern_key(self._qlen))
+        return _QUADRANTS[code]
 
     def predict_next(self):
-        if len(self.sequence_buffer) < 3:
+        if self._qlen < 3:
             return None
-        current_pattern = self._serialize_pattern(list(self.sequence_buffer)[-3:])
-        cached = getattr(self.vault, "posteriori_cache", {}).get(
-            f"habit_{current_pattern}"
-        )
+        current_pattern = self._pattern_key(3)
+        cached = self._posteriori.get(f"habit_{current_pattern}")
         if cached:
             return {
                 "prediction_type": "QUADRANT_TRANSITION",
@@ -158,41 +314,44 @@ class HabitTracker:
             }
         return {"prediction_type": "UNSURE", "confidence": 0.3, "hume_vivacity": 0.4}
 
+    def _coords_to_code(self, coords):
+        # Index is row * 2 + col on the 1920x1080 reference screen
+        return ((coords[1] >= 540) << 1) | (coords[0] >= 960)
+
     def _coords_to_quadrant(self, coords):
-        x, y = coords[0], coords[1]
-        grid_x = 1920 / 2
-        grid_y = 1080 / 2
-        col = 0 if x < grid_x else 1
-        row = 0 if y < grid_y else 1
-        return ["NW", "NE", "SW", "SE"][row * 2 + col]
+        return _QUADRANTS[self._coords_to_code(coords)]
 
-    def _serialize_pattern(self, sequence):
-        return "_".join([s["quadrant"] for s in sequence])
+    def _pattern_key(self, length):
+        # Leading sentinel bit keeps patterns of different lengths distinct
+        return (1 << (2 * length)) | (self._qring & ((1 << (2 * length)) - 1))
 
     def _update_conjunction_frequency(self, pattern_key):
-        if pattern_key not in self.pattern_cache:
-            self.pattern_cache[pattern_key] = {"count": 0}
-        self.pattern_cache[pattern_key]["count"] += 1
+        count = self.pattern_cache.get(pattern_key, 0) + 1
+        self.pattern_cache[pattern_key] = count
+        seen = 0
+        key = pattern_key
+        while key > 1:
+            seen |= 1 << (key & 3)
+            key >>= 2
+        for code, quadrant in enumerate(_QUADRANTS):
+            if seen >> code & 1:
+                self._quadrant_totals[quadrant] += 1
         self.vault.crystallize(
             f"habit_{pattern_key}",
             {
                 "pattern": pattern_key,
-                "frequency": min(self.pattern_cache[pattern_key]["count"] / 10.0, 1.0),
+                "frequency": min(count / 10.0, 1.0),
                 "predicted_next": self._extrapolate_next_quadrant(pattern_key),
                 "temporal_decay": 0.95,
             },
         )
 
     def _extrapolate_next_quadrant(self, pattern_key):
-        parts = pattern_key.split("_")
-        return parts[-1] if len(parts) >= 2 else "UNKNOWN"
+        return _QUADRANTS[pattern_key & 3] if pattern_key >= 1 << 4 else "UNKNOWN"
 
     def get_quadrant_heat(self, quadrant_code):
         """Returns rough usage frequency of a quadrant to aid avoidance."""
-        heat = 0
-        for pattern, data in self.pattern_cache.items():
-            if quadrant_code in pattern:
-                heat += data.get("count", 0)
+        heat = self._quadrant_totals.get(quadrant_code, 0)
         return min(heat / 100.0, 1.0)  # Normalize cap
 
 
@@ -203,11 +362,22 @@ class IntuitiveRecognizer:
         self.hlsf = hlsf_engine
         self.symmetry_threshold = 0.9
         self.density_threshold = 50
+        # (field key, result) memos; both depend only on the field's node set
+        self._sym_cache = (None, 0.0)
+        self._centroid_cache = (None, (0.0, 0.0))
+
+    def _field_key(self):
+        field_map = self.hlsf.field_map
+        return (
+            getattr(self.hlsf, "_revision", None),
+            id(field_map),
+            len(field_map),
+        )
 
     def check_necessity(self, stimulus, current_node):
         field_density = len(self.hlsf.field_map)
+        symmetry_score = self._calculate_bilateral_symmetry()
         if field_density > self.density_threshold:
-            symmetry_score = self._calculate_bilateral_symmetry()
             if symmetry_score > self.symmetry_threshold:
                 necessity_vector = self._calculate_substance_vector(current_node)
                 return {
@@ -222,26 +392,48 @@ class IntuitiveRecognizer:
             "jump_triggered": False,
             "field_density": field_density,
             "spinozan_certainty": 0.0,
-            "substance_unity_score": self._calculate_bilateral_symmetry(),
+            "substance_unity_score": symmetry_score,
         }
 
     def _calculate_bilateral_symmetry(self):
+        key = self._field_key()
+        if self._sym_cache[0] == key:
+            return self._sym_cache[1]
+        score = self._scan_bilateral_symmetry()
+        self._sym_cache = (key, score)
+        return score
+
+    def _scan_bilateral_symmetry(self):
         if not self.hlsf.field_map:
             return 0.0
         nodes = list(self.hlsf.field_map.values())
         if len(nodes) < 2:
             return 0.0
-        mirror_count = 0
-        coords_list = [n.coordinates for n in nodes]
-        for i, c1 in enumerate(coords_list):
-            for c2 in coords_list[i + 1 :]:
-                if len(c1) >= 2 and len(c2) >= 2:
-                    if abs(c1[0] + c2[0]) < 0.2 and abs(c1[1] - c2[1]) < 0.2:
-                        mirror_count += 1
+        # Pairs mirrored across x=0: |x1 + x2| < 0.2 and |y1 - y2| < 0.2
+        xy = np.array(
+            [n.coordinates[:2] for n in nodes if len(n.coordinates) >= 2],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        xs, ys = xy[:, 0], xy[:, 1]
+        mirrored = (np.abs(xs[:, None] + xs[None, :]) < 0.2) & (
+            np.abs(ys[:, None] - ys[None, :]) < 0.2
+        )
+        # Mask is symmetric; drop self-pairs on the diagonal and count each pair once
+        mirror_count = (
+            int(np.count_nonzero(mirrored)) - int(np.count_nonzero(mirrored.diagonal()))
+        ) // 2
         total_pairs = len(nodes) * (len(nodes) - 1) / 2
         return mirror_count / total_pairs if total_pairs > 0 else 0.0
 
     def _calculate_substance_vector(self, current_node):
+        key = self._field_key()
+        if self._centroid_cache[0] == key:
+            return self._centroid_cache[1]
+        vector = self._scan_substance_vector()
+        self._centroid_cache = (key, vector)
+        return vector
+
+    def _scan_substance_vector(self):
         if not self.hlsf.field_map:
             return (0.0, 0.0)
         centroid = [0.0] * min(self.hlsf.dimension, 18)
@@ -279,45 +471,25 @@ class ProprioceptionSystem:
         3. Repulsion from Traffic (Habit Heatmap)
         4. Repulsion from High Entropy (Gravity Field)
         """
-        # Vector to cursor
-        dx = cursor_pos[0] - self.position[0]
-        dy = cursor_pos[1] - self.position[1]
-        dist = (dx**2 + dy**2) ** 0.5
-
-        if dist == 0:
-            return [0, 0]
-
-        # 1. Attract/Repel Cursor (Goldilocks Zone)
-        # If too far, attract. If too close, repel strongly.
-        force_mag = 0.0
-        if dist < self.min_safe_distance:
-            # Strong repulsion
-            force_mag = -1.0 * (self.min_safe_distance - dist) / self.min_safe_distance
-        elif dist > self.target_safe_distance:
-            # Gentle attraction
-            force_mag = 0.5 * (dist - self.target_safe_distance) / 1000.0
-
-        # Base vector
-        nx, ny = dx / dist, dy / dist
-        nav_vector = [nx * force_mag, ny * force_mag]
-
-        # 2. Habit Avoidance (Traffic)
-        # If current location is high-traffic, add slight random jitter or repulsion to keep moving
-        if habit_heatmap and habit_heatmap > 0.5:
-            # Add perpendicular vector to flow? Or just noise to prevent loitering
-            import random
-
-            nav_vector[0] += (random.random() - 0.5) * habit_heatmap
-            nav_vector[1] += (random.random() - 0.5) * habit_heatmap
-
-        # 3. Epistemic Gravity Repulsion (High Entropy/Density)
-        # If density is high (chaotic), pull back further
-        if gravity_density > 0.0:
-            # Push away from cursor more
-            nav_vector[0] -= nx * gravity_density * 0.5
-            nav_vector[1] -= ny * gravity_density * 0.5
-
-        return nav_vector
+        # Habit Avoidance (Traffic): noise to prevent loitering on busy quadrants
+        heat = float(habit_heatmap or 0.0)
+        jx = jy = 0.0
+        if heat > 0.5:
+            jx, jy = ((_RNG.random(2) - 0.5) * heat).tolist()
+
+        vx, vy = _nav_kernel(
+            float(self.position[0]),
+            float(self.position[1]),
+            float(cursor_pos[0]),
+            float(cursor_pos[1]),
+            self.min_safe_distance,
+            self.target_safe_distance,
+            heat,
+            jx,
+            jy,
+            float(gravity_density),
+        )
+        return [vx, vy]
 
 
 class SF_ORB_Controller:
@@ -333,6 +505,9 @@ class SF_ORB_Controller:
         self.gravity_bridge = EpistemicGravityBridge()
         self.proprioception = ProprioceptionSystem()
         self.bayes = BayesianEngine(alpha=1.5, beta=1.0)
+        # Neighbor lists per (n, k) for the current field revision
+        self._neighbor_rev = None
+        self._neighbor_cache = {}
         self._initialize_bayesian_priors()
         print("✓ Triple Triple Architecture Online")
         print("✓ Logic Triad C: Deductive | Inductive | Intuitive")
@@ -348,14 +523,15 @@ class SF_ORB_Controller:
         return False
 
     def cognitively_emerge(self, stimulus):
-        start_time = time.time()
+        start_time = time.perf_counter()
+        wall = time.time()
 
         if not self._check_sovereignty(stimulus):
             return None
 
         self.habit_tracker.record_observation(stimulus)
 
-        gravity_stats = self.gravity_bridge.process_stimulus(stimulus)
+        self.gravity_bridge.submit(stimulus)
 
         # Proprioception Update (Assuming stimulus contains Orb pos, or we simulate it)
         # Since we don't have Orb pos in stimulus commonly, we use the controller's estimation or previous intent
@@ -364,20 +540,12 @@ class SF_ORB_Controller:
         orb_pos = stimulus.get("orb_coordinates", self.proprioception.position)
         self.proprioception.update_physics(orb_pos, 0.1)  # dt approx 0.1s
 
-        # Navigation Logic
-        cursor_pos = stimulus.get("coordinates", [0, 0])
-        gravity_density = gravity_stats.get("renewal_pressure", 0.0)
-
         # Get habit heat for current orb position
         current_orb_quad = self.habit_tracker._coords_to_quadrant(
             self.proprioception.position
         )
         habit_heat = self.habit_tracker.get_quadrant_heat(current_orb_quad)
 
-        nav_vector = self.proprioception.calculate_navigation_vector(
-            cursor_pos, habit_heat, gravity_density
-        )
-
         node = self.engine.map_adjacency(stimulus)
 
         intuition = self.intuitive_recognizer.check_necessity(stimulus, node)
@@ -389,16 +557,24 @@ class SF_ORB_Controller:
 
         bypass = self.vaults.lightning_query(stimulus)
         if bypass:
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (time.perf_counter() - start_time) * 1000
             print(f"⚡ LIGHTNING BYPASS ({elapsed:.2f}ms)")
             return bypass
 
         shadows = self.tribunal.generate_epistemic_shadow(stimulus)
-        bayes_shadows = self._update_bayesian_shadows(shadows)
+        bayes_shadows = self._update_bayesian_shadows(shadows, now=wall)
+
+        # Navigation Logic (field stats are read only after the tribunal work)
+        gravity_stats = self.gravity_bridge.collect()
+        cursor_pos = stimulus.get("coordinates", [0, 0])
+        gravity_density = gravity_stats.get("renewal_pressure", 0.0)
+        nav_vector = self.proprioception.calculate_navigation_vector(
+            cursor_pos, habit_heat, gravity_density
+        )
 
         logic_state = self._synthesize_logic_triad(inductive, intuition, bayes_shadows)
 
-        neighbors = self.engine.get_recursive_neighbors(node, radius=3)
+        neighbors = self._recursive_neighbors(node)
         thought_vec = (
             self.engine.calculate_thought_vector(neighbors + [node])
             if neighbors
@@ -407,16 +583,9 @@ class SF_ORB_Controller:
 
         confidence = self._calculate_convergence(shadows, logic_state, thought_vec)
 
-        spatial_coord = {
-            "node_id": f"NODE_{node.n}_{node.k}",
-            "recursion_depth": node.k,
-            "coordinates": node.coordinates,
-            "adjacency_value": node.adjacency_value,
-        }
-
         thought = CrossDomainPredicate(
             epistemic=shadows,
-            spatial=spatial_coord,
+            spatial=node,
             logic=logic_state,
             synthesis_confidence=confidence,
         )
@@ -430,6 +599,7 @@ class SF_ORB_Controller:
             bayes_shadows=bayes_shadows,
             logic_state=logic_state,
             confidence=confidence,
+            now=wall,
         )
         cali_reflection = ucm_envelope.get("cali_reflection", {})
 
@@ -452,7 +622,7 @@ class SF_ORB_Controller:
             },
         )
 
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         mode = logic_state.get("active_mode", "GUARD")
         print(
             f"🧠 [{mode}] {elapsed:.1f}ms | Density: {logic_state.get('field_density', 0)}"
@@ -460,15 +630,30 @@ class SF_ORB_Controller:
 
         return thought
 
+    def _recursive_neighbors(self, node):
+        """get_recursive_neighbors, memoized per (n, k) for the current node set."""
+        # Adjacency depends only on n/k, so the list is fixed for a given node set;
+        # the thought vector is not cached since node cognitive_load keeps changing
+        rev = (getattr(self.engine, "_revision", None), id(self.engine.field_map))
+        if rev != self._neighbor_rev:
+            self._neighbor_rev = rev
+            self._neighbor_cache = {}
+        key = (node.n, node.k)
+        neighbors = self._neighbor_cache.get(key)
+        if neighbors is None:
+            neighbors = self.engine.get_recursive_neighbors(node, radius=3)
+            self._neighbor_cache[key] = neighbors
+        return neighbors
+
     def _build_correlation_envelope(
-        self, stimulus, shadows, bayes_shadows, logic_state, confidence
+        self, stimulus, shadows, bayes_shadows, logic_state, confidence, now=None
     ):
-        stardate = time.time()
+        stardate = time.time() if now is None else now
         glyph_trace = self._glyph_trace(stimulus, stardate)
-        core_4 = self._build_core_4_returns(shadows, bayes_shadows, logic_state)
-        advisory_plus_one = self._build_advisory_plus_one(core_4)
-        cali_reflection = self._build_cali_reflection(advisory_plus_one, logic_state)
         final_verdict = self._verdict_from_mode(logic_state.get("active_mode"))
+        core_4, advisory_plus_one, cali_reflection = self._build_envelope_parts(
+            shadows, logic_state, final_verdict
+        )
 
         return {
             "stardate": stardate,
@@ -481,40 +666,41 @@ class SF_ORB_Controller:
             "confidence": confidence,
         }
 
-    def _build_core_4_returns(self, shadows, bayes_shadows, logic_state):
+    def _build_envelope_parts(self, shadows, logic_state, advisory_verdict):
+        """Core-4 returns, advisory +1 and CALI reflection from one confidence pass."""
         caleon_shadow = shadows.get("spinoza", {})
         kaygee_shadow = shadows.get("kant", {})
         cali_shadow = shadows.get("hume", {})
         locke_shadow = shadows.get("locke", {})
+        c_caleon = caleon_shadow.get("confidence", 0.5)
+        c_kaygee = kaygee_shadow.get("confidence", 0.5)
+        c_cali = cali_shadow.get("confidence", 0.5)
+        c_locke = locke_shadow.get("confidence", 0.5)
 
-        advisory_verdict = self._verdict_from_mode(logic_state.get("active_mode"))
-        convergence_weights = self._normalize_weights(
-            {
-                "caleon": caleon_shadow.get("confidence", 0.5),
-                "kaygee": kaygee_shadow.get("confidence", 0.5),
-                "cali_x_one": cali_shadow.get("confidence", 0.5),
-                "empirical": locke_shadow.get("confidence", 0.5),
-            }
-        )
-
-        return {
+        total = (c_caleon + c_kaygee + c_cali + c_locke) or 1.0
+        core_4 = {
             "caleon": {
                 "shadow": caleon_shadow,
-                "confidence": caleon_shadow.get("confidence", 0.5),
+                "confidence": c_caleon,
                 "advisory_verdict": advisory_verdict,
             },
             "kaygee": {
                 "shadow": kaygee_shadow,
-                "confidence": kaygee_shadow.get("confidence", 0.5),
+                "confidence": c_kaygee,
                 "advisory_verdict": advisory_verdict,
             },
             "cali_x_one": {
                 "shadow": cali_shadow,
-                "confidence": cali_shadow.get("confidence", 0.5),
+                "confidence": c_cali,
                 "advisory_verdict": advisory_verdict,
             },
             "ecm": {
-                "convergence_weights": convergence_weights,
+                "convergence_weights": {
+                    "caleon": c_caleon / total,
+                    "kaygee": c_kaygee / total,
+                    "cali_x_one": c_cali / total,
+                    "empirical": c_locke / total,
+                },
                 "inputs": {
                     "locke": locke_shadow,
                     "hume": cali_shadow,
@@ -525,26 +711,22 @@ class SF_ORB_Controller:
             },
         }
 
-    def _build_advisory_plus_one(self, core_4):
-        confidences = {
-            "caleon": core_4.get("caleon", {}).get("confidence", 0.5),
-            "kaygee": core_4.get("kaygee", {}).get("confidence", 0.5),
-            "cali_x_one": core_4.get("cali_x_one", {}).get("confidence", 0.5),
-        }
-        weights = self._softmax(list(confidences.values()))
-        gradients = dict(zip(confidences.keys(), weights))
-
-        entropy = -sum(p * math.log(p + 1e-9) for p in weights)
-        spread = (
-            max(confidences.values()) - min(confidences.values())
-            if confidences
-            else 0.0
-        )
-        reweight = entropy > 1.0 or spread > 0.2
+        # Advisory +1 over the three lobe confidences
+        weights = self._softmax([c_caleon, c_kaygee, c_cali])
+        entropy = float(-(weights * np.log(weights + 1e-9)).sum())
+        weights = weights.tolist()
+        spread = max(c_caleon, c_kaygee, c_cali) - min(c_caleon, c_kaygee, c_cali)
+        drift = spread > 0.2
+        anomaly = entropy > 1.0
+        reweight = anomaly or drift
 
-        return {
+        advisory_plus_one = {
             "advisory_only": True,
-            "confidence_gradients": gradients,
+            "confidence_gradients": {
+                "caleon": weights[0],
+                "kaygee": weights[1],
+                "cali_x_one": weights[2],
+            },
             "tension_indicators": {
                 "entropy": entropy,
                 "spread": spread,
@@ -557,34 +739,32 @@ class SF_ORB_Controller:
             ),
         }
 
-    def _build_cali_reflection(self, advisory_plus_one, logic_state):
-        tension = advisory_plus_one.get("tension_indicators", {})
-        entropy = tension.get("entropy", 0.0)
-        spread = tension.get("spread", 0.0)
-
+        # CALI reflection (observational only) from the same entropy/spread
+        tension = logic_state.get("active_mode") == "INTUITION-JUMP" and entropy > 0.9
         events = []
-        if spread > 0.2:
+        if drift:
             events.append(
                 {"type": "drift", "detail": "confidence spread exceeded threshold"}
             )
-        if entropy > 1.0:
+        if anomaly:
             events.append(
                 {"type": "anomaly", "detail": "high entropy in lobe gradients"}
             )
-        if logic_state.get("active_mode") == "INTUITION-JUMP" and entropy > 0.9:
+        if tension:
             events.append(
                 {"type": "tension", "detail": "intuition jump under high entropy"}
             )
 
-        return {
+        cali_reflection = {
             "observational_only": True,
             "events": events,
             "flags": {
-                "drift_detected": any(e["type"] == "drift" for e in events),
-                "anomaly_detected": any(e["type"] == "anomaly" for e in events),
-                "ethical_tension": any(e["type"] == "tension" for e in events),
+                "drift_detected": drift,
+                "anomaly_detected": anomaly,
+                "ethical_tension": tension,
             },
         }
+        return core_4, advisory_plus_one, cali_reflection
 
     def _verdict_from_mode(self, mode):
         if mode == "INTUITION-JUMP":
@@ -596,29 +776,32 @@ class SF_ORB_Controller:
         return "no_act"
 
     def _glyph_trace(self, stimulus, stardate):
-        canonical = json.dumps(stimulus, sort_keys=True, default=str)
+        frozen = _freeze_stimulus(stimulus)
+        if frozen is not None:
+            canonical = _canonical_stimulus(frozen)
+        else:
+            canonical = json.dumps(stimulus, sort_keys=True, default=str)
         payload = f"{stardate}:{canonical}"
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def _softmax(self, values):
-        if not values:
-            return []
-        max_val = max(values)
-        exps = [math.exp(v - max_val) for v in values]
-        total = sum(exps) or 1.0
-        return [e / total for e in exps]
-
-    def _normalize_weights(self, weights):
-        total = sum(weights.values()) or 1.0
-        return {k: v / total for k, v in weights.items()}
+        exps = np.asarray(values, dtype=np.float64)
+        if not exps.size:
+            return exps
+        exps = exps - exps.max()
+        np.exp(exps, out=exps)
+        exps /= exps.sum()
+        return exps
 
     def _check_sovereignty(self, stimulus):
+        if not isinstance(stimulus, dict):
+            return False
+        if stimulus.get("type") not in _BLOCKED_STIMULUS_TYPES:
+            return True
         if stimulus.get("meta", {}).get("test_mode") is True:
             return True
-        if stimulus.get("type") == "surveillance_probe":
-            print("⛔ SOVEREIGNTY VIOLATION: Surveillance detected")
-            return False
-        return True
+        print("⛔ SOVEREIGNTY VIOLATION: Surveillance detected")
+        return False
 
     def _synthesize_logic_triad(self, inductive, intuitive, bayes_shadows):
         live_density = len(self.engine.field_map)
@@ -694,7 +877,8 @@ class SF_ORB_Controller:
             base += 0.08
         if len(shadows) >= 3:
             base += 0.02
-        vec_magnitude = sum(abs(v) for v in thought_vec) if thought_vec else 0.0
+        # Empty-neighbourhood vectors are all zeros, so any() short-circuits them
+        vec_magnitude = sum(map(abs, thought_vec)) if any(thought_vec) else 0.0
         base += min(vec_magnitude * 0.001, 0.02)
         return min(base, 0.99)
 
@@ -714,39 +898,42 @@ class SF_ORB_Controller:
                 reliability=0.01,
             )
 
-    def _update_bayesian_shadows(self, shadows):
-        bayes_view = {}
-        timestamp_id = f"stim_{int(time.time()*1000)}"
+    def _update_bayesian_shadows(self, shadows, now=None):
+        timestamp_id = f"stim_{int((time.time() if now is None else now) * 1000)}"
+        evidence = []
         for mind_name, shadow in shadows.items():
             hyp = f"{mind_name}_pattern_persistence"
-            likelihood = shadow.get("confidence", 0.5)
-            reliability = shadow.get("reliability", 1.0)
             if hyp not in self.bayes.priors:
                 self.bayes.set_prior(hyp, 0.5, evidence_strength=1.0)
-            self.bayes.add_evidence(
-                hypothesis=hyp,
-                evidence_id=f"{timestamp_id}_{mind_name}",
-                likelihood=likelihood,
-                source=mind_name,
-                reliability=reliability,
+            evidence.append(
+                (
+                    hyp,
+                    f"{timestamp_id}_{mind_name}",
+                    shadow.get("confidence", 0.5),
+                    mind_name,
+                    shadow.get("reliability", 1.0),
+                )
             )
-            bayes_view[mind_name] = self.bayes.calculate_posterior(hyp) or likelihood
-        return bayes_view
+        posteriors = self.bayes.batch_update(evidence)
+        return {
+            source: posteriors[hyp] or likelihood
+            for hyp, _, likelihood, source, _ in evidence
+        }
 
     def _update_bayesian_outcome(self, logic_state):
         mode = logic_state.get("active_mode", "GUARD")
         pred = logic_state.get("inductive_prediction", {}) or {}
         success = mode in ("HABIT", "GUARD-HABIT") and pred.get("confidence", 0) > 0.4
-        self.bayes.update_with_outcome("habit_continues", success=success, weight=0.7)
         jump_success = mode == "INTUITION-JUMP" and logic_state.get(
             "intuitive_jump_triggered"
         )
-        self.bayes.update_with_outcome(
-            "jump_necessary", success=bool(jump_success), weight=0.6
-        )
         guard_success = mode == "GUARD" and not success and not jump_success
-        self.bayes.update_with_outcome(
-            "guard_sufficient", success=guard_success, weight=0.5
+        self.bayes.update_with_outcomes(
+            [
+                ("habit_continues", success, 0.7),
+                ("jump_necessary", bool(jump_success), 0.6),
+                ("guard_sufficient", guard_success, 0.5),
+            ]
         )
 
 
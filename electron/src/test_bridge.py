@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Test the floating assistant orb bridge."""
 
+import atexit
+import functools
 import json
 import sys
 import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from contextlib import redirect_stdout
 from io import StringIO
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
@@ -12,29 +16,47 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from floating_assistant_orb import CALIFloatingOrb
 
+HABIT_REPEATS = 5
+# Single-step cursor jump (pixels) that counts as a discontinuity
+DISCONTINUITY_PX = 300
 
-def test_bridge():
-    print("Testing CALI Floating Orb Bridge - INTUITION-JUMP Validation...")
 
+@dataclass(slots=True, frozen=True)
+class Stimulus:
+    """Text query stimulus; asdict() gives the dict cognitively_emerge expects."""
+
+    type: str
+    content: str
+    coordinates: tuple = (0, 0)
+    velocity: float = 0.0
+
+
+@functools.lru_cache(maxsize=1)
+def get_orb():
+    """Start one orb per process and reuse it across test phases."""
     orb = CALIFloatingOrb(PROJECT_ROOT)
     orb.start()
-
+    atexit.register(orb.stop)
     print("✓ Orb started")
+    return orb
+
+
+def test_bridge(orb=None):
+    print("Testing CALI Floating Orb Bridge - INTUITION-JUMP Validation...")
+
+    orb = orb or get_orb()
 
     # Phase 1: Build HABIT with repeated concrete queries
     print("\n--- Phase 1: Building HABIT ---")
-    habit_queries = ["2 + 2 = ?", "2 + 2 = ?", "2 + 2 = ?", "2 + 2 = ?", "2 + 2 = ?"]
+    query = "2 + 2 = ?"
     habit_results = []
+    # Same stimulus every time; each repetition still runs the full pipeline
+    # since the habit climb is what this phase measures
+    stimulus = Stimulus(type="text_query", content=query)
 
-    for i, query in enumerate(habit_queries):
+    for i in range(HABIT_REPEATS):
         print(f"Habit query {i+1}: '{query}'")
-        stimulus = {
-            "type": "text_query",
-            "content": query,
-            "coordinates": [0, 0],
-            "velocity": 0.0,
-        }
-        result = orb.controller.cognitively_emerge(stimulus)
+        result = orb.controller.cognitively_emerge(asdict(stimulus))
         if result:
             if hasattr(result, "pulse"):
                 pulse = result.pulse()
@@ -69,13 +91,8 @@ def test_bridge():
         "Prove that all triangles are isosceles using only the concept of infinity"
     )
     print(f"Novelty query: '{novelty_query}'")
-    stimulus = {
-        "type": "text_query",
-        "content": novelty_query,
-        "coordinates": [0, 0],
-        "velocity": 0.0,
-    }
-    result = orb.controller.cognitively_emerge(stimulus)
+    stimulus = Stimulus(type="text_query", content=novelty_query)
+    result = orb.controller.cognitively_emerge(asdict(stimulus))
     if result:
         if hasattr(result, "pulse"):
             pulse = result.pulse()
@@ -106,10 +123,19 @@ def test_bridge():
     # Then sudden discontinuity
     print("Sudden cursor discontinuity...")
     orb.process_cursor_movement(800, 600)  # Large jump
+    if orb.recent_cursor_steps(2).max(initial=0.0) > DISCONTINUITY_PX:
+        print("✓ Cursor discontinuity detected")
+    else:
+        print("✗ Cursor discontinuity not detected")
 
-    orb.stop()
     print("\n✓ INTUITION-JUMP validation test complete")
 
 
 if __name__ == "__main__":
-    test_bridge()
+    # Collect the report and write it once rather than one write per print
+    report = StringIO()
+    try:
+        with redirect_stdout(report):
+            test_bridge()
+    finally:
+        sys.stdout.write(report.getvalue())
@@ -2,92 +2,140 @@
 """Full pipeline test simulating Electron IPC."""
 
 import json
+import os
 import sys
 import subprocess
 import time
+from contextlib import redirect_stdout
+from io import StringIO
 from pathlib import Path
 
+# orjson encodes straight to bytes and parses several times faster when installed
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+
+    def _json_loads(data):
+        return json.loads(bytes(data))
+
+    # Compact, non-ASCII-escaping encoder built once (orjson's output format)
+    _ENCODE = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def _json_dumps(obj):
+        return _ENCODE(obj).encode("utf-8")
+
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 
 
+# Reply type -> line reported when it arrives
+_RESPONSE_CHECKS = {
+    "cognitive_pulse": "✓ Cognitive pulse received from cursor movement",
+    "query_result": "✓ Query result received",
+    "status_response": "✓ Status response received",
+    "shutdown_ack": "✓ Shutdown acknowledged",
+}
+
+
+def send(proc, msg):
+    """Write one 4-byte little-endian length-prefixed JSON frame."""
+    send_all(proc, [msg])
+
+
+def send_all(proc, msgs):
+    """Write several frames with a single scatter-gather write where available."""
+    bufs = []
+    for msg in msgs:
+        data = _json_dumps(msg)
+        bufs.append(len(data).to_bytes(4, "little"))
+        bufs.append(data)
+    fd = proc.stdin.fileno()
+    total = sum(map(len, bufs))
+    written = os.writev(fd, bufs) if hasattr(os, "writev") else 0
+    # Short writes (or no writev, e.g. on Windows) finish with plain writes
+    if written < total:
+        view = memoryview(b"".join(bufs))[written:]
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+# Receive buffer shared by every frame; replaced only if a frame outgrows it
+_recv_buf = bytearray(65536)
+
+
+def _read_into(stream, view):
+    offset = 0
+    while offset < len(view):
+        count = stream.readinto(view[offset:])
+        if not count:
+            return False
+        offset += count
+    return True
+
+
+def recv(proc):
+    """Read one framed JSON message, or None once the child closes stdout."""
+    global _recv_buf
+    view = memoryview(_recv_buf)
+    if not _read_into(proc.stdout, view[:4]):
+        return None
+    size = int.from_bytes(view[:4], "little")
+    if size > len(_recv_buf):
+        _recv_buf = bytearray(size)
+        view = memoryview(_recv_buf)
+    payload = view[:size]
+    if not _read_into(proc.stdout, payload):
+        return None
+    return _json_loads(payload)
+
+
 def test_full_pipeline():
     print("Testing full cognitive pipeline with simulated IPC...")
 
     # Start the Python process
     proc = subprocess.Popen(
-        [sys.executable, "floating_assistant_orb.py"],
+        [sys.executable, "floating_assistant_orb.py", "--framed"],
         cwd=str(Path(__file__).parent),
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        stderr=None,  # inherited, so an unread pipe can never fill up
+        bufsize=0,
     )
 
     try:
         # Wait for ready signal
-        ready_line = proc.stdout.readline().strip()
-        ready_msg = json.loads(ready_line)
-        if ready_msg.get("type") == "ready":
+        ready_msg = recv(proc)
+        if ready_msg and ready_msg.get("type") == "ready":
             print("✓ Python process ready")
         else:
             print(f"✗ Unexpected ready message: {ready_msg}")
             return
 
-        # Send cursor movement
-        cursor_msg = {"type": "cursor_move", "x": 500, "y": 300}
-        proc.stdin.write(json.dumps(cursor_msg) + "\n")
-        proc.stdin.flush()
-        print(f"Sent: {cursor_msg}")
-
-        # Read response
-        response_line = proc.stdout.readline().strip()
-        if response_line:
-            response = json.loads(response_line)
-            print(f"Received: {response}")
-            if response.get("type") == "cognitive_pulse":
-                print("✓ Cognitive pulse received from cursor movement")
-
-        # Send query
-        query_msg = {"type": "query", "text": "Hello world"}
-        proc.stdin.write(json.dumps(query_msg) + "\n")
-        proc.stdin.flush()
-        print(f"Sent: {query_msg}")
-
-        # Read response
-        response_line = proc.stdout.readline().strip()
-        if response_line:
-            response = json.loads(response_line)
-            print(f"Received: {response}")
-            if response.get("type") == "query_result":
-                print("✓ Query result received")
-
-        # Send get_status
-        status_msg = {"type": "get_status"}
-        proc.stdin.write(json.dumps(status_msg) + "\n")
-        proc.stdin.flush()
-        print(f"Sent: {status_msg}")
-
-        # Read response
-        response_line = proc.stdout.readline().strip()
-        if response_line:
-            response = json.loads(response_line)
+        # Pipeline every request back-to-back, then drain the replies
+        requests = [
+            {"type": "cursor_move", "x": 500, "y": 300},
+            {"type": "query", "text": "Hello world"},
+            {"type": "get_status"},
+            {"type": "shutdown"},
+        ]
+        send_all(proc, requests)
+        for msg in requests:
+            print(f"Sent: {msg}")
+
+        # get_status is answered inline while cognition is queued, so replies
+        # can arrive out of request order; shutdown_ack is always last
+        while True:
+            response = recv(proc)
+            if response is None:
+                print("✗ Child closed stdout before acknowledging shutdown")
+                break
             print(f"Received: {response}")
-            if response.get("type") == "status_response":
-                print("✓ Status response received")
-
-        # Send shutdown
-        shutdown_msg = {"type": "shutdown"}
-        proc.stdin.write(json.dumps(shutdown_msg) + "\n")
-        proc.stdin.flush()
-        print(f"Sent: {shutdown_msg}")
-
-        # Read shutdown ack
-        response_line = proc.stdout.readline().strip()
-        if response_line:
-            response = json.loads(response_line)
-            print(f"Received: {response}")
-            if response.get("type") == "shutdown_ack":
-                print("✓ Shutdown acknowledged")
+            response_type = response.get("type")
+            check = _RESPONSE_CHECKS.get(response_type)
+            if check:
+                print(check)
+            if response_type == "shutdown_ack":
+                break
 
         print("✓ Full pipeline test complete")
 
@@ -99,4 +147,10 @@ def test_full_pipeline():
 
 
 if __name__ == "__main__":
-    test_full_pipeline()
+    # Collect the report and write it once rather than one write per print
+    report = StringIO()
+    try:
+        with redirect_stdout(report):
+            test_full_pipeline()
+    finally:
+        sys.stdout.write(report.getvalue())
@@ -1,40 +1,51 @@
 #!/usr/bin/env python3
 """Test script to verify SF-ORB cognitive pipeline instantiation."""
 
+import functools
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 sys.path.insert(0, str(PROJECT_ROOT))
 
-try:
+
+@functools.lru_cache(maxsize=1)
+def get_controller():
+    """Build the controller once and reuse the warmed instance."""
     from orb_controller import SF_ORB_Controller
 
-    print("✓ SF_ORB_Controller imported successfully")
+    return SF_ORB_Controller()
+
+
+def main():
+    try:
+        controller = get_controller()
+        print("✓ SF_ORB_Controller imported and instantiated successfully")
+
+        # Test basic cognitive emergence
+        test_stimulus = {
+            "type": "cursor_movement",
+            "coordinates": [100, 200],
+            "velocity": 5.0,
+            "intent": "navigation",
+        }
 
-    controller = SF_ORB_Controller()
-    print("✓ SF_ORB_Controller instantiated successfully")
+        result = controller.cognitively_emerge(test_stimulus)
+        if result:
+            print("✓ Cognitive emergence successful")
+            print(f"  - Confidence: {result.confidence}")
+            print(f"  - Mode: {result.pulse().get('cognitive_mode')}")
+        else:
+            print("✗ Cognitive emergence returned None")
 
-    # Test basic cognitive emergence
-    test_stimulus = {
-        "type": "cursor_movement",
-        "coordinates": [100, 200],
-        "velocity": 5.0,
-        "intent": "navigation",
-    }
+        print("✓ Cognitive pipeline verification complete")
 
-    result = controller.cognitively_emerge(test_stimulus)
-    if result:
-        print("✓ Cognitive emergence successful")
-        print(f"  - Confidence: {result.confidence}")
-        print(f"  - Mode: {result.pulse().get('cognitive_mode')}")
-    else:
-        print("✗ Cognitive emergence returned None")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        import traceback
 
-    print("✓ Cognitive pipeline verification complete")
+        traceback.print_exc()
 
-except Exception as e:
-    print(f"✗ Error: {e}")
-    import traceback
 
-    traceback.print_exc()
+if __name__ == "__main__":
+    main()